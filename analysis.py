@@ -0,0 +1,367 @@
+"""Pivot, Bid & Price Analysis, dan Price Movement Analysis dari merge data.
+
+Semua tabel dihitung per round secara incremental lewat ``RoundComparison``:
+menambah Round N+1 hanya memproses baris round itu (kolom pivot baru dan
+baris bid analysis baru), bukan menghitung ulang seluruh merge data.
+Statistik Price Movement dihitung sekali jalan dari pivot lewat
+``movement_kernel`` (operasi array di matrix series x rounds).
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+
+TOTAL = "TOTAL"
+
+TREND_NO_CHANGE = "No Change"
+TREND_DOWN = "Consistently Down"
+TREND_UP = "Consistently Up"
+TREND_FLUCTUATING = "Fluctuating"
+TREND_LABELS = [TREND_NO_CHANGE, TREND_DOWN, TREND_UP, TREND_FLUCTUATING]
+
+
+def split_columns(merged):
+    # ROUND, VENDOR, <kolom label...>, PRICE (kolom numeric selalu terakhir)
+    columns = list(merged.columns)
+    return columns[2:-1], columns[-1]
+
+
+def total_mask(df, label_cols):
+    return df[label_cols[0]].astype(str).str.strip().str.upper().eq(TOTAL).to_numpy()
+
+
+def bid_kernel(prices):
+    """Bid & Price Analysis untuk matrix harga (rows x vendors) sekaligus.
+
+    NaN = vendor tidak bid. 1st Lowest = harga terendah; 2nd Lowest = harga
+    *berbeda* berikutnya (vendor yang seri dengan 1st tidak dihitung). Kalau
+    seri, vendor dengan index kolom paling kecil yang dipilih (argmin selalu
+    ambil kemunculan pertama), jadi hasilnya deterministik. Index vendor -1
+    berarti tidak ada.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    n_rows, n_vendors = prices.shape
+    rows = np.arange(n_rows)
+
+    filled = np.where(np.isnan(prices), np.inf, prices)
+
+    first_idx = filled.argmin(axis=1) if n_vendors else np.zeros(n_rows, dtype=np.int64)
+    first = filled[rows, first_idx] if n_vendors else np.full(n_rows, np.inf)
+
+    above = np.where(filled > first[:, None], filled, np.inf)
+    second_idx = above.argmin(axis=1) if n_vendors else np.zeros(n_rows, dtype=np.int64)
+    second = above[rows, second_idx] if n_vendors else np.full(n_rows, np.inf)
+
+    no_first = np.isinf(first)
+    no_second = np.isinf(second)
+    first_idx = np.where(no_first, -1, first_idx)
+    second_idx = np.where(no_second, -1, second_idx)
+    first = np.where(no_first, np.nan, first)
+    second = np.where(no_second, np.nan, second)
+
+    with warnings.catch_warnings():
+        # baris tanpa bid sama sekali -> median NaN, tidak perlu warning
+        warnings.simplefilter("ignore", RuntimeWarning)
+        median = np.nanmedian(prices, axis=1) if n_vendors else np.full(n_rows, np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gap = (second - first) / first * 100
+        to_median = (prices - median[:, None]) / median[:, None] * 100
+
+    return {
+        "first": first,
+        "first_idx": first_idx,
+        "second": second,
+        "second_idx": second_idx,
+        "gap": gap,
+        "median": median,
+        "to_median": to_median,
+    }
+
+
+def vendor_names(vendors, idx):
+    names = np.array(list(vendors) + [None], dtype=object)
+    return names[idx]  # idx -1 -> None (elemen terakhir)
+
+
+def bid_price_analysis_round(wide, vendors):
+    """Bid & Price Analysis untuk satu round (``wide`` = baris scope x kolom vendor)."""
+    result = bid_kernel(wide[vendors].to_numpy(dtype=np.float64))
+
+    analysis = wide[vendors].copy()
+    analysis["1st Lowest"] = result["first"]
+    analysis["1st Vendor"] = vendor_names(vendors, result["first_idx"])
+    analysis["2nd Lowest"] = result["second"]
+    analysis["2nd Vendor"] = vendor_names(vendors, result["second_idx"])
+    analysis["Gap 1 to 2 (%)"] = result["gap"]
+    analysis["Median Price"] = result["median"]
+
+    to_median = pd.DataFrame(
+        result["to_median"], index=wide.index, columns=[f"{v} to Median (%)" for v in vendors]
+    )
+    return pd.concat([analysis, to_median], axis=1)
+
+
+def movement_kernel(prices):
+    """Price Movement untuk matrix (series vendor·scope x rounds) sekaligus.
+
+    NaN = vendor tidak bid di round itu. Round kosong di tengah dilewati:
+    setiap langkah dibandingkan dengan harga terakhir yang ada sebelumnya
+    (forward fill), jadi trend dan reduction hanya memakai harga yang ada.
+    PRICE STABILITY INDEX = besar perubahan harga round pertama -> terakhir
+    (|PRICE REDUCTION (%)|), sesuai tabel contoh di user guide. PRICE TREND
+    dikembalikan sebagai Categorical.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    n_rows, n_rounds = prices.shape
+    observed = ~np.isnan(prices)
+    has_any = observed.any(axis=1)
+
+    # forward fill sepanjang round (index kolom terakhir yang terisi)
+    last_seen = np.where(observed, np.arange(n_rounds), -1)
+    np.maximum.accumulate(last_seen, axis=1, out=last_seen)
+    ffilled = np.where(last_seen >= 0, prices[np.arange(n_rows)[:, None], np.maximum(last_seen, 0)], np.nan)
+
+    first_col = observed.argmax(axis=1)
+    first = np.where(has_any, prices[np.arange(n_rows), first_col], np.nan)
+    last = ffilled[:, -1] if n_rounds else np.full(n_rows, np.nan)
+
+    # langkah valid = round ini ada harga dan sudah ada harga sebelumnya
+    step = np.diff(ffilled, axis=1)
+    valid = observed[:, 1:] & (last_seen[:, :-1] >= 0)
+    sign = np.sign(np.where(valid, step, 0.0))
+    ups = ((sign > 0) & valid).sum(axis=1)
+    downs = ((sign < 0) & valid).sum(axis=1)
+    steps = valid.sum(axis=1)
+
+    trend = np.select(
+        [ups + downs == 0, downs == steps, ups == steps],
+        [TREND_NO_CHANGE, TREND_DOWN, TREND_UP],
+        default=TREND_FLUCTUATING,
+    ).astype(object)
+    trend[~has_any] = None
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        std = np.nanstd(prices, axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        reduction = last - first
+        reduction_pct = reduction / first * 100
+        stability = np.abs(reduction_pct)
+
+    return {
+        "PRICE REDUCTION (VALUE)": reduction,
+        "PRICE REDUCTION (%)": reduction_pct,
+        "PRICE TREND": pd.Categorical(trend, categories=TREND_LABELS),
+        "STANDARD DEVIATION": std,
+        "PRICE STABILITY INDEX (%)": stability,
+    }
+
+
+MOVEMENT_STAT_COLS = [
+    "PRICE REDUCTION (VALUE)",
+    "PRICE REDUCTION (%)",
+    "PRICE TREND",
+    "STANDARD DEVIATION",
+    "PRICE STABILITY INDEX (%)",
+]
+
+
+class RoundComparison:
+    """State incremental untuk perbandingan UPL round by round.
+
+    Tambahkan round satu per satu lewat ``add_round`` (urutan pemanggilan =
+    urutan round); ``pivot()``, ``bid_price_analysis()`` dan
+    ``price_movement()`` menyusun tabel dari state yang sudah ada. Index
+    pivot yang sudah urut disimpan, dan hanya di-sort ulang kalau round baru
+    membawa scope baru. ``add_round`` hanya mengerjakan bagian pivot; bid
+    kernel untuk round baru dijalankan saat ``bid_price_analysis()`` dipanggil,
+    jadi waktu pivot dan bid analysis bisa diukur terpisah.
+    """
+
+    def __init__(self, label_cols, price_col):
+        self.label_cols = list(label_cols)
+        self.price_col = price_col
+        self.rounds = []
+        self.vendors = []
+        self._label_dtypes = {}
+        self._pivot_index = None
+        self._pivot_columns = {}
+        self._bid_parts = []
+        self._pending_bids = []
+        self._cache = {}
+
+    @classmethod
+    def from_merge(cls, merged):
+        label_cols, price_col = split_columns(merged)
+        comparison = cls(label_cols, price_col)
+        comparison.add_merge(merged)
+        return comparison
+
+    def copy(self):
+        """Salinan state; ``add_round`` di salinan tidak mengubah yang asli.
+
+        Potongan tabel (kolom pivot, baris bid per round) tidak pernah diubah
+        in-place, jadi dipakai bersama, tidak di-copy.
+        """
+        other = type(self)(self.label_cols, self.price_col)
+        other.rounds = list(self.rounds)
+        other.vendors = list(self.vendors)
+        other._label_dtypes = dict(self._label_dtypes)
+        other._pivot_index = self._pivot_index
+        other._pivot_columns = dict(self._pivot_columns)
+        other._bid_parts = list(self._bid_parts)
+        other._pending_bids = list(self._pending_bids)
+        return other
+
+    def nbytes(self):
+        """Perkiraan memori state (kolom pivot, potongan bid, tabel yang sudah disusun)."""
+        # kolom pivot berbagi satu index -> index dihitung sekali
+        total = sum(int(s.memory_usage(index=False, deep=True)) for s in self._pivot_columns.values())
+        if self._pivot_index is not None:
+            total += int(self._pivot_index.memory_usage(deep=True))
+        frames = self._bid_parts + [scopes for _, scopes, _ in self._pending_bids] + list(self._cache.values())
+        return total + sum(int(df.memory_usage(index=True, deep=True).sum()) for df in frames)
+
+    def add_merge(self, merged):
+        """Tambah semua round di merge data (urutan round dari ingest)."""
+        # ROUND categorical (dari ingest) sudah ordered natural -> group ikut urutan kategori
+        by_category = isinstance(merged["ROUND"].dtype, pd.CategoricalDtype)
+        for _, round_df in merged.groupby("ROUND", sort=by_category, observed=True):
+            self.add_round(round_df)
+        return self
+
+    def add_round(self, round_df):
+        """Tambah satu round (baris merge data dengan ROUND yang sama)."""
+        round_name = round_df["ROUND"].iat[0]
+        if round_name in self.rounds:
+            raise ValueError(f"{round_name} sudah ditambahkan")
+        self.rounds.append(round_name)
+        self._label_dtypes = {col: round_df[col].dtype for col in self.label_cols}
+
+        for vendor in pd.unique(round_df["VENDOR"]):
+            if vendor not in self.vendors:
+                self.vendors.append(vendor)
+
+        # baris scope x vendor untuk round ini (termasuk TOTAL)
+        wide = (
+            round_df.groupby(self.label_cols + ["VENDOR"], sort=False, dropna=False, observed=True)[self.price_col]
+            .sum(min_count=1)
+            .unstack("VENDOR")
+        )
+        round_vendors = [v for v in self.vendors if v in wide.columns]
+        wide = wide[round_vendors]
+        self._extend_pivot(round_name, wide)
+
+        is_total = total_mask(wide.index.to_frame(index=False), self.label_cols)
+        self._pending_bids.append((round_name, wide[~is_total], round_vendors))
+
+        self._cache.clear()
+
+    def _flush_bids(self):
+        # ===== BID & PRICE ANALYSIS =====
+        # list baru di-assign sekaligus: state bersama tidak pernah setengah jadi
+        parts = list(self._bid_parts)
+        for round_name, scopes, round_vendors in self._pending_bids:
+            bid = bid_price_analysis_round(scopes, round_vendors)
+            bid.insert(0, "ROUND", round_name)
+            parts.append(bid)
+        self._bid_parts, self._pending_bids = parts, []
+
+    # ===== TABEL =====
+    def _with_label_dtypes(self, frame):
+        # round lama (ditambahkan sebelum append_merge) punya kategori label lebih
+        # sedikit -> samakan dengan kategori merge data terbaru
+        for col, dtype in self._label_dtypes.items():
+            s = frame[col]
+            if not (isinstance(s.dtype, pd.CategoricalDtype) and isinstance(dtype, pd.CategoricalDtype)
+                    and s.cat.categories.equals(dtype.categories)):
+                frame[col] = s.astype(dtype)
+        return frame
+
+    def _sorted_index(self, index):
+        # urut alfabet, TOTAL selalu paling bawah
+        frame = index.to_frame(index=False)
+        is_total = total_mask(frame, self.label_cols)
+        order = np.lexsort([frame[c].astype(str).to_numpy() for c in reversed(self.label_cols)] + [is_total])
+        return index[order]
+
+    def _extend_pivot(self, round_name, wide):
+        index = self._pivot_index
+        if index is None:
+            index = self._sorted_index(wide.index)
+        else:
+            new_keys = wide.index.difference(index, sort=False)
+            if len(new_keys):
+                # scope baru -> urutkan ulang, kolom round lama ikut di-reindex
+                index = self._sorted_index(index.append(new_keys))
+                self._pivot_columns = {c: s.reindex(index) for c, s in self._pivot_columns.items()}
+        self._pivot_index = index
+
+        for vendor in wide.columns:
+            self._pivot_columns[(vendor, round_name)] = wide[vendor].reindex(index)
+
+    def pivot(self):
+        if "pivot" not in self._cache:
+            columns = [(v, r) for v in self.vendors for r in self.rounds if (v, r) in self._pivot_columns]
+            if columns:
+                pivot = pd.DataFrame(
+                    {f"{v} {r}": self._pivot_columns[(v, r)] for v, r in columns}, index=self._pivot_index
+                )
+            else:
+                pivot = pd.DataFrame()
+            self._cache["pivot"] = self._with_label_dtypes(pivot.reset_index())
+        return self._cache["pivot"]
+
+    def bid_price_analysis(self):
+        if "bid" not in self._cache:
+            self._flush_bids()
+            vendor_cols = list(self.vendors)
+            stat_cols = ["1st Lowest", "1st Vendor", "2nd Lowest", "2nd Vendor", "Gap 1 to 2 (%)", "Median Price"]
+            median_cols = [f"{v} to Median (%)" for v in vendor_cols]
+            columns = ["ROUND"] + vendor_cols + stat_cols + median_cols
+            bid = pd.concat([part.reindex(columns=columns) for part in self._bid_parts]).reset_index()
+            bid["ROUND"] = pd.Categorical(bid["ROUND"], categories=self.rounds, ordered=True)
+            self._cache["bid"] = self._with_label_dtypes(bid[["ROUND"] + self.label_cols + columns[1:]])
+        return self._cache["bid"]
+
+    def price_movement(self):
+        if "movement" not in self._cache:
+            pivot = self.pivot().set_index(self.label_cols)
+            blocks = []
+            for vendor in self.vendors:
+                block = pivot.reindex(columns=[f"{vendor} {r}" for r in self.rounds])
+                block.columns = list(self.rounds)
+                block = block.dropna(how="all").reset_index()
+                block.insert(0, "VENDOR", vendor)
+                blocks.append(block)
+            movement = pd.concat(blocks, ignore_index=True)
+            movement["VENDOR"] = pd.Categorical(movement["VENDOR"], categories=self.vendors)
+
+            # satu kali kernel untuk semua series vendor·scope
+            stats = movement_kernel(movement[self.rounds].to_numpy(dtype=np.float64))
+            is_total = total_mask(movement, self.label_cols)
+            for col in MOVEMENT_STAT_COLS:
+                values = stats[col]
+                if col == "PRICE TREND":
+                    values = values.copy()
+                    values[is_total] = np.nan
+                else:
+                    values = np.where(is_total, np.nan, values)
+                movement[col] = values
+
+            self._cache["movement"] = movement
+        return self._cache["movement"]
+
+
+def build_pivot(merged):
+    return RoundComparison.from_merge(merged).pivot()
+
+
+def bid_price_analysis(merged):
+    return RoundComparison.from_merge(merged).bid_price_analysis()
+
+
+def price_movement_analysis(merged):
+    return RoundComparison.from_merge(merged).price_movement()
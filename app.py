@@ -1,49 +1,18 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import time
-import re
-import io
-import zipfile
-from io import BytesIO
-
-def format_rupiah(x):
-    if pd.isna(x):
-        return ""
-    # pastikan bisa diubah ke float
-    try:
-        x = float(x)
-    except:
-        return x  # biarin apa adanya kalau bukan angka
-
-    # kalau tidak punya desimal (misal 7000.0), tampilkan tanpa ,00
-    if x.is_integer():
-        formatted = f"{int(x):,}".replace(",", ".")
-    else:
-        formatted = f"{x:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-        # hapus ,00 kalau desimalnya 0 semua (misal 7000,00 → 7000)
-        if formatted.endswith(",00"):
-            formatted = formatted[:-3]
-    return formatted
-
-def highlight_total(row):
-    # Cek apakah ada kolom yang berisi "TOTAL" (case-insensitive)
-    if any(str(x).strip().upper() == "TOTAL" for x in row):
-        return ["font-weight: bold; background-color: #D9EAD3; color: #1A5E20;"] * len(row)
-    else:
-        return [""] * len(row)
-    
-def highlight_1st_2nd(row, columns):
-    styles = [""] * len(columns)
-    first_vendor = row.get("1st Vendor")
-    second_vendor = row.get("2nd Vendor")
-
-    for i, col in enumerate(columns):
-        if col == first_vendor:
-            styles[i] = "background-color: #C6EFCE; color: #006100;"
-        elif col == second_vendor:
-            styles[i] = "background-color: #FFEB9C; color: #9C6500;"
-    return styles
+import os
+from arrow_tables import arrow_backed
+from charts import trend_chart, trend_counts, wins_chart, wins_per_round
+from debug_view import debug_sidebar, start_rerun_profile
+from dummy_dataset import BASE_DIR, DUMMY_FILES, build_dummy_zip, dataset_fingerprint
+from formatting import RED_TOTAL_STYLE, total_styles, vendor_styles
+from job_view import job_panel
+from super_button import cached_multi_sheet_excel
+from table_view import paged_dataframe
+from warmup import start_warmup
+
+# timing per stage untuk rerun ini (sidebar debug: ?debug=1)
+rerun_profile = start_rerun_profile()
 
 st.subheader("🧑‍🏫 User Guide: UPL Comparison Round by Round")
 st.markdown(
@@ -360,15 +329,7 @@ data = [
 ]
 df = pd.DataFrame(data, columns=columns)
 
-def red_highlight(row):
-    if any(str(x).strip().upper() == "TOTAL" for x in row):
-        return [
-            "background-color: #FFE5E5; color: #D00000; font-weight: 700;"
-        ] * len(row)
-    return [""] * len(row)
-
-
-df_styled = df.style.apply(red_highlight, axis=1)
+df_styled = df.style.apply(total_styles, axis=None, style=RED_TOTAL_STYLE)
 
 st.dataframe(df_styled, hide_index=True)
 
@@ -390,15 +351,13 @@ st.divider()
 
 st.markdown("#### What is Displayed?")
 
-# Path file Excel yang sudah ada
-file_paths = ["Round 1.xlsx", "Round 2.xlsx", "Round 3.xlsx", "Round 4.xlsx"]
+# ZIP dummy dataset di-cache per proses (dipakai bersama semua session),
+# key = fingerprint file di disk, jadi rerun tidak baca & kompres ulang
+@st.cache_resource(show_spinner=False)
+def get_dummy_zip(fingerprint):
+    return build_dummy_zip(fingerprint)
 
-# Buat ZIP di memory
-zip_buffer = io.BytesIO()
-with zipfile.ZipFile(zip_buffer, "w") as zf:
-    for file_path in file_paths:
-        zf.write(file_path, arcname=file_path.split("/")[-1])  # arcname = nama file di ZIP
-zip_buffer.seek(0)
+zip_bytes = get_dummy_zip(dataset_fingerprint())
 
 # Markdown teks
 st.markdown(
@@ -417,7 +376,7 @@ def release_the_balloons():
 # Download button untuk file Excel
 st.download_button(
     label="Dummy Dataset",
-    data=zip_buffer,
+    data=zip_bytes,
     file_name="Dummy Dataset - UPL Comparison Round by Round.zip",
     mime="application/zip",
     on_click=release_the_balloons,
@@ -425,6 +384,16 @@ st.download_button(
     use_container_width=True,
 )
 
+# Jalankan pipeline yang sebenarnya pada dummy dataset di background:
+# progress per stage, bisa di-cancel, dan tetap nempel ke job yang sama saat rerun
+with st.expander("Run the analysis on the dummy dataset"):
+    job_panel(
+        [os.path.join(BASE_DIR, file_path) for file_path in DUMMY_FILES],
+        key="dummy_job",
+        label="Run in background",
+        file_name="Super Botton - UPL Comparison Round by Round.xlsx",
+    )
+
 st.markdown(
     """
     <div style="text-align: justify; font-size: 15px; margin-bottom: 20px">
@@ -509,16 +478,10 @@ data = [
     ["Round 4", "Vendor C", "AirCon Dismantle", 3175],
     ["Round 4", "Vendor C", "TOTAL", 72825],
 ]
-df_merge = pd.DataFrame(data, columns=columns)
+df_merge = arrow_backed(pd.DataFrame(data, columns=columns))
 
 num_cols = ["PRICE"]
-df_merge_styled = (
-    df_merge.style
-    .format({col: format_rupiah for col in num_cols})
-    .apply(highlight_total, axis=1)
-)
-
-st.dataframe(df_merge_styled, hide_index=True)
+paged_dataframe(df_merge, "merge", num_cols)
 
 st.write("")
 st.markdown("**:orange-badge[2. PIVOT TABLE]**")
@@ -541,15 +504,10 @@ data = [
     ["Site Survey", 15000,14950,14900,14900,14800,14800,14750,14750,15050,15000,14900,14850],
     ["TOTAL", 73230,73130,73000,72950,73140,73040,72870,72850,73150,73100,72875,72825]
 ]
-df_pivot = pd.DataFrame(data, columns=columns)
+df_pivot = arrow_backed(pd.DataFrame(data, columns=columns))
 
 num_cols = ["VENDOR A Round 1", "VENDOR A Round 2", "VENDOR A Round 3", "VENDOR A Round 4", "VENDOR B Round 1", "VENDOR B Round 2", "VENDOR B Round 3", "VENDOR B Round 4", "VENDOR C Round 1", "VENDOR C Round 2", "VENDOR C Round 3", "VENDOR C Round 4"]
-df_pivot_styled = (
-    df_pivot.style
-    .format({col: format_rupiah for col in num_cols})
-    .apply(highlight_total, axis=1)
-)
-st.dataframe(df_pivot_styled, hide_index=True)
+paged_dataframe(df_pivot, "pivot", num_cols)
 
 st.write("")
 st.markdown("**:yellow-badge[3. BID & PRICE ANALYSIS]**")
@@ -593,23 +551,16 @@ data = [
     ["ROUND 4", "DG Dismantle", 54900, 54900, 54800, 54800 ,"VENDOR C", 54900,"VENDOR A", 0.2, 54900, 0, 0, -0.2],
     ["ROUND 4", "AirCon Dismantle", 3150, 3200, 3175, 3150, "VENDOR A", 3175, "VENDOR C", 0.8, 3175, -0.8, 0.8, 0],
 ]
-df_analysis = pd.DataFrame(data, columns=columns)
+df_analysis = arrow_backed(pd.DataFrame(data, columns=columns))
 
 num_cols = ["VENDOR A", "VENDOR B", "VENDOR C", "1st Lowest", "2nd Lowest", "Median Price"]
-format_dic = {col: format_rupiah for col in num_cols}
-format_dic.update({"Gap 1 to 2 (%)": "{:.1f}%"})
+format_dic = {"Gap 1 to 2 (%)": "%.1f%%"}
 
 vendor_cols = ["Vendor A", "Vendor B", "Vendor C"]
 for v in vendor_cols:
-    format_dic[f"{v} to Median (%)"] = "{:+.1f}%"
+    format_dic[f"{v} to Median (%)"] = "%+.1f%%"
 
-df_analysis_styled = (
-    df_analysis.style
-    .format(format_dic)
-    .apply(lambda row: highlight_1st_2nd(row, df_analysis.columns), axis=1)
-)
-
-st.dataframe(df_analysis_styled, hide_index=True)
+paged_dataframe(df_analysis, "analysis", num_cols, format_dic, highlight=vendor_styles)
 
 st.write("")
 st.markdown("**:green-badge[4. PRICE MOVEMENT ANALYSIS]**")
@@ -645,22 +596,15 @@ data = [
 ]
 
 df_pmove = pd.DataFrame(data, columns=columns)
-df_pmove = df_pmove.map(lambda x: None if x == "" else x)
+df_pmove = arrow_backed(df_pmove.map(lambda x: None if x == "" else x))
 
 num_cols = ["Round 1", "Round 2", "Round 3", "Round 4", "PRICE REDUCTION (VALUE)", "STANDARD DEVIATION"]
-format_dict = {col: format_rupiah for col in num_cols}
-format_dict.update({
-    "PRICE REDUCTION (%)": "{:+.1f}%",
-    "PRICE STABILITY INDEX (%)": "{:.1f}%"
-})
-
-df_pmove_styled = (
-    df_pmove.style
-    .format(format_dict)
-    .apply(highlight_total, axis=1)
-)
+format_dict = {
+    "PRICE REDUCTION (%)": "%+.1f%%",
+    "PRICE STABILITY INDEX (%)": "%.1f%%"
+}
 
-st.dataframe(df_pmove_styled, hide_index=True)
+paged_dataframe(df_pmove, "pmove", num_cols, format_dict)
 
 st.write("")
 st.markdown("**:blue-badge[5. VISUALIZATION]**")
@@ -679,7 +623,7 @@ st.markdown(
 tab1, tab2 = st.tabs(["Winning Performance", "Price Trend"])
 
 with tab1:
-    st.image("assets/1.png")
+    st.altair_chart(wins_chart(wins_per_round(df_analysis)), width="stretch")
     with st.expander("See explanation"):
             st.caption('''
                 The visualization above shows the number of wins each vendor
@@ -703,7 +647,7 @@ with tab1:
             ''')
 
 with tab2:
-    st.image("assets/2.png")
+    st.altair_chart(trend_chart(trend_counts(df_pmove)), width="stretch")
     with st.expander("See explanation"):
             st.caption('''
                 The chart above shows the number of occurrences of each **Price 
@@ -749,126 +693,15 @@ selected_sheets = st.multiselect(
     default=list(dataframes.keys())  # default semua dipilih
 )
 
-# Fungsi "Super Button" & Formatting
-def generate_multi_sheet_excel(selected_sheets, df_dict):
-
-    output = BytesIO()
-
-    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-        for sheet in selected_sheets:
-            df_raw = df_dict[sheet].copy()
-
-            # ===== COERCE NUMERIC SAFELY =====
-            df = df_raw.copy()
-            numeric_cols = []
-
-            for col in df.columns:
-                coerced = pd.to_numeric(df[col], errors="coerce")
-                if coerced.notna().any():
-                    df[col] = coerced
-                    numeric_cols.append(col)
-
-            pct_cols = [c for c in df.columns if "%" in c]
-
-            df.to_excel(writer, index=False, sheet_name=sheet)
-            workbook  = writer.book
-            worksheet = writer.sheets[sheet]
-
-            # ===== FORMAT =====
-            fmt_rupiah = workbook.add_format({"num_format": "#,##0"})
-            fmt_pct    = workbook.add_format({'num_format': '#,##0.0"%"'})
-
-            fmt_total = workbook.add_format({
-                "bold": True,
-                "bg_color": "#D9EAD3",
-                "font_color": "#1A5E20",
-                "num_format": "#,##0"
-            })
-
-            fmt_first = workbook.add_format({
-                "bg_color": "#C6EFCE",
-                "num_format": "#,##0"
-            })
-
-            fmt_second = workbook.add_format({
-                "bg_color": "#FFEB9C",
-                "num_format": "#,##0"
-            })
-
-            # ===== COLUMN FORMAT =====
-            for col_idx, col_name in enumerate(df.columns):
-                if col_name in numeric_cols:
-                    worksheet.set_column(col_idx, col_idx, 15, fmt_rupiah)
-                if col_name in pct_cols:
-                    worksheet.set_column(col_idx, col_idx, 15, fmt_pct)
-
-            # ===== LOOP DATA =====
-            for row_idx, row in enumerate(df.itertuples(index=False), start=1):
-
-                is_total_row = any(
-                    isinstance(x, str) and x.strip().upper() == "TOTAL"
-                    for x in row
-                    if pd.notna(x)
-                )
-
-                # Bid & Price vendor index
-                first_idx = second_idx = None
-                if sheet == "Bid & Price Analysis":
-                    first_vendor  = row[df.columns.get_loc("1st Vendor")]
-                    second_vendor = row[df.columns.get_loc("2nd Vendor")]
-
-                    if first_vendor in numeric_cols:
-                        first_idx = df.columns.get_loc(first_vendor)
-                    if second_vendor in numeric_cols:
-                        second_idx = df.columns.get_loc(second_vendor)
-
-                for col_idx, col_name in enumerate(df.columns):
-                    value = row[col_idx]
-                    fmt = None
-
-                    # ===== PICK FORMAT =====
-                    if sheet == "Bid & Price Analysis":
-                        if col_idx == first_idx:
-                            fmt = fmt_first
-                        elif col_idx == second_idx:
-                            fmt = fmt_second
-                    elif is_total_row:
-                        fmt = fmt_total
-
-                    # ===== WRITE CELL (TYPE SAFE) =====
-                    if pd.isna(value) or (isinstance(value, float) and np.isinf(value)):
-                        worksheet.write_blank(row_idx, col_idx, None, fmt)
-
-                    elif col_name in pct_cols:
-                        worksheet.write_number(
-                            row_idx, col_idx, value, fmt or fmt_pct
-                        )
-
-                    elif col_name in numeric_cols:
-                        worksheet.write_number(
-                            row_idx, col_idx, value, fmt or fmt_rupiah
-                        )
-
-                    else:
-                        worksheet.write(row_idx, col_idx, value, fmt)
-
-            # ===== AUTOFIT =====
-            for i, col in enumerate(df.columns):
-                worksheet.set_column(
-                    i, i,
-                    max(len(str(col)), df[col].astype(str).map(len).max()) + 2
-                )
-
-    output.seek(0)
-    return output.getvalue()
-
 # ---- DOWNLOAD BUTTON ----
+# workbook baru dibuat saat tombol diklik (callable), hasilnya di-memo per
+# urutan sheet + fingerprint dataframe
 if selected_sheets:
-    excel_bytes = generate_multi_sheet_excel(selected_sheets, dataframes)
+    sheets_to_export = list(selected_sheets)
 
     st.download_button(
         label="Download",
-        data=excel_bytes,
+        data=lambda: cached_multi_sheet_excel(sheets_to_export, dataframes),
         file_name="Super Botton - UPL Comparison Round by Round.xlsx",
         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         type="primary",
@@ -890,4 +723,10 @@ st.markdown(
     unsafe_allow_html=True
 )
 
-st.video("https://youtu.be/yZTRQbr3sqA?si=-eNXGSLwrhV2by0C")
\ No newline at end of file
+st.video("https://youtu.be/yZTRQbr3sqA?si=-eNXGSLwrhV2by0C")
+
+# cache bersama (analisis & export dummy dataset, Super Button dengan pilihan sheet
+# default) diisi sekali per proses, setelah halaman terkirim
+start_warmup(exports=[(list(dataframes), dataframes)])
+
+debug_sidebar(rerun_profile)
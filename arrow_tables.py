@@ -0,0 +1,33 @@
+"""Tabel hasil analisis sebagai DataFrame Arrow-backed (pd.ArrowDtype).
+
+st.dataframe mengirim tabel ke frontend dalam format Arrow; kolom yang sudah
+ArrowDtype tidak perlu dikonversi/di-copy lagi setiap rerun. Kolom numeric
+dan teks dikonversi sekali saat tabel selesai dihitung. Kolom categorical
+(ROUND, VENDOR, label di merge data) dibiarkan: sudah dikirim sebagai Arrow
+dictionary tanpa konversi string, dan urutan ROUND (ordered) tetap terjaga.
+"""
+import pandas as pd
+import pyarrow as pa
+
+
+def arrow_column(s):
+    if isinstance(s.dtype, (pd.ArrowDtype, pd.CategoricalDtype)):
+        return s
+    try:
+        # from_pandas: NaN/None -> null; buffer numeric dipakai langsung (tanpa copy)
+        array = pa.array(s.to_numpy(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # kolom object campuran (angka + teks) dibiarkan apa adanya
+        return s
+    if pa.types.is_null(array.type):
+        return s
+    return pd.Series(pd.arrays.ArrowExtensionArray(array), index=s.index, name=s.name)
+
+
+def arrow_backed(df):
+    """Salinan dangkal ``df`` dengan kolom numeric & teks sebagai pd.ArrowDtype."""
+    return pd.DataFrame({col: arrow_column(df[col]) for col in df.columns}, index=df.index)
+
+
+def arrow_backed_tables(tables):
+    return {name: arrow_backed(df) for name, df in tables.items()}
@@ -0,0 +1,74 @@
+"""Benchmark: Bid & Price Analysis, vectorized kernel vs row-wise apply.
+
+Matrix harga acak (rows x vendors) dengan harga seri dan bid kosong (NaN).
+Hasil kernel dicek sama dengan referensi row-wise sebelum waktu dicetak.
+
+    python benchmarks/bench_bid_analysis.py --rows 100000 --vendors 50
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis import bid_kernel  # noqa: E402
+
+
+def make_prices(n_rows, n_vendors, nan_ratio=0.05, seed=0):
+    rng = np.random.default_rng(seed)
+    # dibulatkan ke ratusan supaya banyak harga seri
+    prices = np.round(rng.uniform(10_000, 12_000, size=(n_rows, n_vendors)), -2)
+    prices[rng.random(prices.shape) < nan_ratio] = np.nan
+    prices[::97] = np.nan  # beberapa baris tanpa bid sama sekali
+    return prices
+
+
+def bid_row(prices):
+    valid = prices.dropna()
+    if valid.empty:
+        return pd.Series([np.nan, -1, np.nan, -1, np.nan])
+    first = valid.min()
+    rest = valid[valid > first]
+    second = rest.min() if not rest.empty else np.nan
+    second_idx = rest.idxmin() if not rest.empty else -1
+    return pd.Series([first, valid.idxmin(), second, second_idx, valid.median()])
+
+
+def row_wise(prices):
+    df = pd.DataFrame(prices)
+    return df.apply(bid_row, axis=1).to_numpy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--vendors", type=int, default=50)
+    args = parser.parse_args()
+
+    prices = make_prices(args.rows, args.vendors)
+    print(f"{args.rows:,} rows x {args.vendors} vendors")
+
+    start = time.perf_counter()
+    result = bid_kernel(prices)
+    kernel_s = time.perf_counter() - start
+    print(f"kernel    : {kernel_s:8.3f} s")
+
+    start = time.perf_counter()
+    ref = row_wise(prices)
+    ref_s = time.perf_counter() - start
+    print(f"row-wise  : {ref_s:8.3f} s")
+    print(f"speedup   : {ref_s / kernel_s:8.1f}x")
+
+    got = np.column_stack([
+        result["first"], result["first_idx"], result["second"], result["second_idx"], result["median"]
+    ])
+    np.testing.assert_allclose(got, ref.astype(float), equal_nan=True)
+    print("result    : identical to row-wise reference")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Memory regression check: peak allocation of the Super Button export.
+
+Mengukur peak alokasi (tracemalloc) saat export Merge Data sintetis, mode
+in-memory vs streaming (constant_memory), untuk beberapa jumlah baris. Exit
+code 1 kalau peak mode streaming melewati ``--max-peak-mb``, atau kalau peak
+di ukuran terbesar lebih dari ``--max-growth`` kali peak di ukuran terkecil
+(memory mode streaming harus datar, tidak ikut naik dengan jumlah baris).
+
+    python benchmarks/bench_export_memory.py --rows 250000 1000000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from super_button import generate_multi_sheet_excel, stream_multi_sheet_excel  # noqa: E402
+
+
+def make_merge_frame(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    n_scopes = 1_000
+    scope = rng.integers(0, n_scopes, size=n_rows)
+    df = pd.DataFrame({
+        "ROUND": pd.Categorical.from_codes(rng.integers(0, 6, size=n_rows), [f"Round {i}" for i in range(1, 7)]),
+        "VENDOR": pd.Categorical.from_codes(rng.integers(0, 40, size=n_rows), [f"VENDOR {i}" for i in range(1, 41)]),
+        "Scope": pd.Categorical.from_codes(scope, [f"Scope {i}" for i in range(n_scopes)]),
+        "PRICE": rng.integers(1_000, 100_000, size=n_rows).astype(float),
+    })
+    # label pakai object dtype seperti hasil merge biasa
+    for col in ["ROUND", "VENDOR", "Scope"]:
+        df[col] = df[col].astype(object)
+    df.loc[::1_000, "Scope"] = "TOTAL"
+    return df
+
+
+def measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(*args)
+    if hasattr(result, "close"):
+        result.close()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[250_000, 1_000_000])
+    parser.add_argument("--max-peak-mb", type=float, default=128.0)
+    parser.add_argument("--max-growth", type=float, default=1.5)
+    parser.add_argument("--skip-in-memory", action="store_true")
+    args = parser.parse_args()
+
+    peaks = {}
+    for n_rows in sorted(args.rows):
+        df_dict = {"Merge Data": make_merge_frame(n_rows)}
+        sheets = list(df_dict)
+        input_mb = df_dict["Merge Data"].memory_usage(deep=True).sum() / 2**20
+        print(f"{n_rows:,} rows, input frame {input_mb:.1f} MB")
+
+        if not args.skip_in_memory:
+            elapsed, peak = measure(generate_multi_sheet_excel, sheets, df_dict)
+            print(f"  in-memory : {elapsed:7.2f} s  peak {peak:8.1f} MB")
+
+        elapsed, peak = measure(stream_multi_sheet_excel, sheets, df_dict)
+        print(f"  streaming : {elapsed:7.2f} s  peak {peak:8.1f} MB  (budget {args.max_peak_mb:.0f} MB)")
+        peaks[n_rows] = peak
+
+    failed = False
+    if max(peaks.values()) > args.max_peak_mb:
+        print("FAIL: streaming export peak above budget")
+        failed = True
+
+    if len(peaks) > 1:
+        smallest, largest = min(peaks), max(peaks)
+        growth = peaks[largest] / peaks[smallest]
+        print(f"streaming peak {largest:,} vs {smallest:,} rows: {growth:.2f}x (max {args.max_growth:.2f}x)")
+        if growth > args.max_growth:
+            print("FAIL: streaming export peak grows with row count")
+            failed = True
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
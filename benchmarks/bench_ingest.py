@@ -0,0 +1,75 @@
+"""Benchmark: ingestion file ROUND, serial vs process pool.
+
+File Round 1-4 bawaan repo direplikasi N kali (Round 1 ... Round 4N), lalu
+di-ingest dengan ``max_workers=1`` dan dengan process pool. Satu run pemanasan
+per mode dibuang (import openpyxl, page cache, start pool), lalu serial dan
+parallel diukur bergantian (urutan dibalik setiap repeat) dan yang dilaporkan
+median-nya, supaya urutan run tidak ikut menentukan speedup.
+
+    python benchmarks/bench_ingest.py --copies 10 --workers 4 --repeats 5
+"""
+import argparse
+import io
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dummy_dataset import DUMMY_FILES  # noqa: E402
+from ingest import ingest_rounds  # noqa: E402
+
+
+def replicated_uploads(copies):
+    contents = []
+    for file_name in DUMMY_FILES:
+        with open(os.path.join(ROOT, file_name), "rb") as f:
+            contents.append(f.read())
+
+    uploads = []
+    for i in range(copies * len(contents)):
+        upload = io.BytesIO(contents[i % len(contents)])
+        upload.name = f"Round {i + 1}.xlsx"
+        uploads.append(upload)
+    return uploads
+
+
+def timed(copies, max_workers):
+    uploads = replicated_uploads(copies)
+    start = time.perf_counter()
+    df = ingest_rounds(uploads, max_workers=max_workers)
+    return time.perf_counter() - start, len(df)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    modes = {"serial": 1, "parallel": args.workers}
+
+    # pemanasan, tidak dihitung
+    for max_workers in modes.values():
+        _, n_rows = timed(args.copies, max_workers)
+
+    runs = {name: [] for name in modes}
+    for i in range(args.repeats):
+        order = list(modes) if i % 2 == 0 else list(reversed(modes))
+        for name in order:
+            runs[name].append(timed(args.copies, modes[name])[0])
+
+    serial_s = statistics.median(runs["serial"])
+    parallel_s = statistics.median(runs["parallel"])
+    print(f"{args.copies * len(DUMMY_FILES)} files, {n_rows:,} merged rows, median of {args.repeats} runs")
+    print(f"cpu_count: {os.cpu_count()}")
+    print(f"serial   : {serial_s:7.2f} s")
+    print(f"parallel : {parallel_s:7.2f} s  (workers={args.workers or os.cpu_count()})")
+    print(f"speedup  : {serial_s / parallel_s:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
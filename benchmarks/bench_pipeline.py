@@ -0,0 +1,213 @@
+"""Benchmark: seluruh pipeline round comparison per stage, hasil dalam JSON.
+
+File ``Round N.xlsx`` sintetis dibuat sesuai layout di user guide: satu sheet
+per vendor, floating table (posisi acak), kolom non-numeric di depan dan satu
+kolom PRICE di akhir. Setiap stage (ingest, merge, pivot, bid analysis,
+movement analysis, Styler, export) diukur wall time-nya, lalu dijalankan
+sekali lagi di bawah tracemalloc untuk peak memory (parsing di process pool
+tidak terhitung di peak memory karena berjalan di proses lain).
+
+    python benchmarks/bench_pipeline.py --rounds 6 --vendors 10 --scopes 2000 --output bench.json
+    python benchmarks/bench_pipeline.py ... --baseline bench.json --tolerance 1.25
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis import RoundComparison, split_columns  # noqa: E402
+from arrow_tables import arrow_backed_tables  # noqa: E402
+from formatting import total_styles, vendor_styles  # noqa: E402
+from ingest import merge_tables, parse_file, sort_rounds  # noqa: E402
+from pipeline import TABLES  # noqa: E402
+from super_button import generate_multi_sheet_excel  # noqa: E402
+from table_view import PAGE_SIZE, highlighted  # noqa: E402
+
+STAGES = ["ingest", "merge", "pivot", "bid_analysis", "movement_analysis", "styler", "export"]
+
+# stage yang lebih cepat dari ini tidak dicek terhadap baseline (noise)
+MIN_COMPARE_SECONDS = 0.05
+
+
+def make_round_files(n_rounds, n_vendors, n_scopes, n_labels=1, seed=0):
+    """[(nama file, bytes xlsx)] untuk Round 1..N."""
+    rng = np.random.default_rng(seed)
+    labels = ["Scope"] + [f"Desc {i}" for i in range(1, n_labels)]
+    scopes = [[f"{label} {s}" for label in labels] for s in range(1, n_scopes + 1)]
+    base = rng.integers(1_000, 100_000, size=n_scopes)
+
+    files = []
+    for r in range(1, n_rounds + 1):
+        wb = openpyxl.Workbook(write_only=True)
+        for v in range(1, n_vendors + 1):
+            ws = wb.create_sheet(f"Vendor {v}")
+            # floating table: baris & kolom kosong acak sebelum header
+            top, left = rng.integers(0, 6, size=2)
+            for _ in range(top):
+                ws.append([])
+            pad = [None] * int(left)
+            prices = np.round(base * rng.uniform(0.9, 1.1, size=n_scopes), -1)
+
+            ws.append(pad + labels + ["PRICE"])
+            for scope, price in zip(scopes, prices.tolist()):
+                ws.append(pad + scope + [price])
+
+        buffer = io.BytesIO()
+        wb.save(buffer)
+        files.append((f"Round {r}.xlsx", buffer.getvalue()))
+    return files
+
+
+def ingest(files, max_workers):
+    tasks = sort_rounds(files)
+    if max_workers == 1:
+        parsed = [parse_file(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            parsed = list(pool.map(parse_file, tasks))
+    return [item for items in parsed for item in items]
+
+
+def render_styler(tables, style_rows):
+    # sama seperti table_view: satu halaman per tabel; Styler (rupiah + highlight)
+    # di-render, halaman tanpa Styler dikirim sebagai Arrow table
+    for sheet, df in tables.items():
+        page = df.iloc[:style_rows] if style_rows else df
+        num_cols = [c for c in page.columns if pd.api.types.is_numeric_dtype(page[c].dtype) and "%" not in c]
+        view = highlighted(page, vendor_styles if sheet == "Bid & Price Analysis" else total_styles, num_cols)
+        if isinstance(view, pd.DataFrame):
+            pa.Table.from_pandas(view, preserve_index=False)
+        else:
+            view.to_html()
+
+
+def rows_of(result):
+    if isinstance(result, pd.DataFrame):
+        return len(result)
+    if isinstance(result, list):
+        return sum(len(df) for _, _, df in result)
+    return None
+
+
+def run_stages(files, max_workers, style_rows, trace=False):
+    """{stage: (detik, peak MB atau None, jumlah baris)} untuk satu run pipeline."""
+    results = {}
+
+    def stage(name, func):
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        result = func()
+        seconds = time.perf_counter() - start
+        peak_mb = None
+        if trace:
+            peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+        results[name] = (seconds, peak_mb, rows_of(result))
+        return result
+
+    parsed = stage("ingest", lambda: ingest(files, max_workers))
+    merged = stage("merge", lambda: merge_tables(parsed))
+    # pivot: groupby/unstack per round + susun tabel; bid_analysis: bid kernel per round
+    comparison = RoundComparison(*split_columns(merged))
+    tables = arrow_backed_tables({
+        "Merge Data": merged,
+        "Pivot Table": stage("pivot", lambda: comparison.add_merge(merged).pivot()),
+        "Bid & Price Analysis": stage("bid_analysis", comparison.bid_price_analysis),
+        "Price Movement Analysis": stage("movement_analysis", comparison.price_movement),
+    })
+    stage("styler", lambda: render_styler(tables, style_rows))
+    stage("export", lambda: generate_multi_sheet_excel(TABLES, tables))
+    return results
+
+
+def compare(report, baseline, tolerance):
+    """Cetak rasio terhadap baseline; return daftar stage yang regresi."""
+    regressions = []
+    for name in STAGES:
+        new = report["stages"][name]["seconds"]
+        old = baseline.get("stages", {}).get(name, {}).get("seconds")
+        if not old:
+            continue
+        ratio = new / old
+        flag = ""
+        if ratio > tolerance and new >= MIN_COMPARE_SECONDS:
+            regressions.append(name)
+            flag = "  <-- REGRESSION"
+        print(f"{name:18s} {old:8.3f} s -> {new:8.3f} s  ({ratio:5.2f}x){flag}", file=sys.stderr)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=4)
+    parser.add_argument("--vendors", type=int, default=10)
+    parser.add_argument("--scopes", type=int, default=1000)
+    parser.add_argument("--labels", type=int, default=1, help="jumlah kolom non-numeric")
+    parser.add_argument("--workers", type=int, default=None, help="1 = parsing serial")
+    parser.add_argument("--style-rows", type=int, default=PAGE_SIZE, help="0 = style seluruh tabel")
+    parser.add_argument("--no-memory", action="store_true", help="lewati run tracemalloc")
+    parser.add_argument("--output", help="tulis JSON ke file (default stdout)")
+    parser.add_argument("--baseline", help="JSON run sebelumnya untuk dibandingkan")
+    parser.add_argument("--tolerance", type=float, default=1.25)
+    args = parser.parse_args()
+
+    files = make_round_files(args.rounds, args.vendors, args.scopes, args.labels)
+
+    timings = run_stages(files, args.workers, args.style_rows)
+    peaks = {} if args.no_memory else run_stages(files, args.workers, args.style_rows, trace=True)
+
+    report = {
+        "params": {
+            "rounds": args.rounds,
+            "vendors": args.vendors,
+            "scopes": args.scopes,
+            "labels": args.labels,
+            "workers": args.workers,
+            "style_rows": args.style_rows,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "cpu_count": os.cpu_count(),
+        },
+        "stages": {
+            name: {
+                "seconds": round(seconds, 4),
+                "peak_mb": round(peaks[name][1], 2) if name in peaks else None,
+                "rows": rows,
+            }
+            for name, (seconds, _, rows) in timings.items()
+        },
+    }
+    report["total_seconds"] = round(sum(s["seconds"] for s in report["stages"].values()), 4)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if compare(report, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark: cold start halaman Streamlit terhadap target waktu.
+
+Setiap pengukuran dijalankan di proses Python baru (cold):
+
+- imports   : import modul app sendiri sebelum elemen pertama dikirim
+              (streamlit & pandas sudah ter-import, seperti di server)
+- first run : run pertama app.py lewat streamlit AppTest
+- rerun     : run kedua di proses yang sama
+
+Exit 1 kalau median melewati target.
+
+    python benchmarks/bench_startup.py --repeat 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# target hasil pengukuran setelah lazy import (imports ~30 ms, first run ~1,5 s
+# di container 1 vCPU); diberi ruang supaya tidak flaky
+TARGET_IMPORTS_MS = 150
+TARGET_FIRST_RUN_MS = 2500
+
+APP_MODULES = "arrow_tables, charts, debug_view, dummy_dataset, formatting, job_view, lru, super_button, table_view, warmup"
+
+IMPORTS_SCRIPT = f"""
+import json, time
+import streamlit, pandas
+start = time.perf_counter()
+import {APP_MODULES}
+print(json.dumps({{"imports_ms": (time.perf_counter() - start) * 1000}}))
+"""
+
+RUN_SCRIPT = """
+import json, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file("app.py", default_timeout=120)
+start = time.perf_counter()
+at.run()
+first = time.perf_counter() - start
+start = time.perf_counter()
+at.run()
+rerun = time.perf_counter() - start
+assert not at.exception, [e.value for e in at.exception]
+print(json.dumps({"first_run_ms": first * 1000, "rerun_ms": rerun * 1000}))
+"""
+
+
+def measure(script):
+    out = subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--target-imports-ms", type=float, default=TARGET_IMPORTS_MS)
+    parser.add_argument("--target-first-run-ms", type=float, default=TARGET_FIRST_RUN_MS)
+    args = parser.parse_args()
+
+    samples = {"imports_ms": [], "first_run_ms": [], "rerun_ms": []}
+    for _ in range(args.repeat):
+        for script in (IMPORTS_SCRIPT, RUN_SCRIPT):
+            for key, value in measure(script).items():
+                samples[key].append(value)
+
+    medians = {key: statistics.median(values) for key, values in samples.items()}
+    targets = {"imports_ms": args.target_imports_ms, "first_run_ms": args.target_first_run_ms}
+
+    failed = False
+    for key, value in medians.items():
+        target = targets.get(key)
+        status = ""
+        if target is not None:
+            ok = value <= target
+            failed |= not ok
+            status = f"(target {target:.0f} ms: {'OK' if ok else 'FAIL'})"
+        print(f"{key:13s} {value:8.1f} ms  {status}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""Benchmark: Super Button export, legacy per-cell loop vs vectorized engine.
+
+Hasil vectorized dicek cell per cell terhadap legacy (value, number format,
+fill, bold) lewat openpyxl, untuk data benchmark dan satu set tabel kecil
+berisi NaN / inf / TOTAL / kolom campur; exit 1 kalau ada yang beda. Lebar
+kolom tidak dibandingkan (sengaja berbeda sejak estimasi lebar dari format).
+
+Juga membandingkan export streaming serial vs paralel per sheet (process pool).
+Mode paralel opt-in (UPL_PARALLEL_EXPORT=1); hasil di mesin 1 CPU tidak
+menunjukkan scaling, jalankan di mesin multi-core sebelum mengaktifkannya.
+
+Jalankan dari root repo:
+
+    python benchmarks/bench_super_button.py --rounds 6 --vendors 40 --scopes 5000
+"""
+import argparse
+import os
+import sys
+import time
+from io import BytesIO
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from super_button import (  # noqa: E402
+    generate_multi_sheet_excel,
+    write_parallel_workbook,
+    write_serial_workbook,
+)
+
+
+def make_dataframes(n_rounds, n_vendors, n_scopes, seed=0):
+    rng = np.random.default_rng(seed)
+    rounds = [f"Round {r}" for r in range(1, n_rounds + 1)]
+    vendors = [f"VENDOR {v}" for v in range(1, n_vendors + 1)]
+    scopes = [f"Scope {s}" for s in range(1, n_scopes + 1)]
+
+    base = rng.integers(1_000, 100_000, size=n_scopes).astype(float)
+    prices = base[None, None, :] * rng.uniform(0.9, 1.1, size=(n_rounds, n_vendors, n_scopes))
+    prices = np.round(prices)
+
+    # ===== MERGE DATA =====
+    blocks = []
+    for r, rnd in enumerate(rounds):
+        for v, vendor in enumerate(vendors):
+            p = prices[r, v]
+            blocks.append(pd.DataFrame({
+                "ROUND": rnd,
+                "VENDOR": vendor,
+                "Scope": scopes + ["TOTAL"],
+                "PRICE": np.append(p, p.sum()),
+            }))
+    df_merge = pd.concat(blocks, ignore_index=True)
+
+    # ===== PIVOT TABLE =====
+    pivot = {"Scope": scopes + ["TOTAL"]}
+    for v, vendor in enumerate(vendors):
+        for r, rnd in enumerate(rounds):
+            p = prices[r, v]
+            pivot[f"{vendor} {rnd}"] = np.append(p, p.sum())
+    df_pivot = pd.DataFrame(pivot)
+
+    # ===== BID & PRICE ANALYSIS =====
+    mat = prices.transpose(0, 2, 1).reshape(-1, n_vendors)
+    order = np.argsort(mat, axis=1, kind="stable")
+    rows = np.arange(len(mat))
+    first, second = mat[rows, order[:, 0]], mat[rows, order[:, 1]]
+    median = np.median(mat, axis=1)
+    vendor_arr = np.array(vendors, dtype=object)
+    df_analysis = pd.DataFrame(mat, columns=vendors)
+    df_analysis.insert(0, "Scope", np.tile(scopes, n_rounds))
+    df_analysis.insert(0, "ROUND", np.repeat(rounds, n_scopes))
+    df_analysis["1st Lowest"] = first
+    df_analysis["1st Vendor"] = vendor_arr[order[:, 0]]
+    df_analysis["2nd Lowest"] = second
+    df_analysis["2nd Vendor"] = vendor_arr[order[:, 1]]
+    df_analysis["Gap 1 to 2 (%)"] = (second - first) / first * 100
+    df_analysis["Median Price"] = median
+    for v, vendor in enumerate(vendors):
+        df_analysis[f"{vendor} to Median (%)"] = (mat[:, v] - median) / median * 100
+
+    # ===== PRICE MOVEMENT ANALYSIS =====
+    series = prices.transpose(1, 2, 0).reshape(-1, n_rounds)
+    df_pmove = pd.DataFrame(series, columns=rounds)
+    df_pmove.insert(0, "Scope", np.tile(scopes, n_vendors))
+    df_pmove.insert(0, "VENDOR", np.repeat(vendors, n_scopes))
+    df_pmove["PRICE REDUCTION (VALUE)"] = series[:, -1] - series[:, 0]
+    df_pmove["PRICE REDUCTION (%)"] = df_pmove["PRICE REDUCTION (VALUE)"] / series[:, 0] * 100
+    df_pmove["PRICE TREND"] = "Fluctuating"
+    df_pmove["STANDARD DEVIATION"] = series.std(axis=1, ddof=1)
+    df_pmove["PRICE STABILITY INDEX (%)"] = df_pmove["STANDARD DEVIATION"] / series.mean(axis=1) * 100
+
+    return {
+        "Merge Data": df_merge,
+        "Pivot Table": df_pivot,
+        "Bid & Price Analysis": df_analysis,
+        "Price Movement Analysis": df_pmove,
+    }
+
+
+def edge_dataframes():
+    """Tabel kecil dengan kasus tepi: NaN, inf, TOTAL (case / spasi), kolom campur."""
+    nan, inf = np.nan, np.inf
+    labels = ["Scope A", " total ", "Scope C", "TOTAL"]
+    return {
+        "Merge Data": pd.DataFrame({
+            "ROUND": ["Round 1", "Round 1", "Round 2", "Round 2"],
+            "VENDOR": ["A", "A", "B", None],
+            "Scope": labels,
+            "PRICE": [1500.0, nan, inf, 7000.5],
+        }),
+        "Pivot Table": pd.DataFrame({
+            "Scope": labels,
+            "A Round 1": [1.0, -inf, nan, 12_345_678.9],
+            "Mixed": ["x", 2, None, "3"],
+            "Empty": [None, None, None, None],
+        }),
+        "Bid & Price Analysis": pd.DataFrame({
+            "ROUND": ["Round 1"] * 4,
+            "Scope": labels,
+            "A": [100.0, nan, 300.0, 50.0],
+            "B": [90.0, 200.0, nan, 50.0],
+            "1st Lowest": [90.0, 200.0, 300.0, 50.0],
+            "1st Vendor": ["B", "B", "A", "A"],
+            "2nd Lowest": [100.0, nan, nan, nan],
+            "2nd Vendor": ["A", None, "Z", None],
+            "Gap 1 to 2 (%)": [11.1, nan, inf, nan],
+        }),
+        "Price Movement Analysis": pd.DataFrame({
+            "VENDOR": ["A", "A", "B", "B"],
+            "Scope": labels,
+            "Round 1": [100.0, nan, 5.0, 1.0],
+            "PRICE TREND": ["Consistently Down", None, "No Change", "Fluctuating"],
+            "PRICE STABILITY INDEX (%)": [2.5, nan, -inf, 0.0],
+        }),
+    }
+
+
+def cell_signature(cell):
+    fill = cell.fill.fgColor.rgb if cell.fill is not None and cell.fill.fill_type else None
+    return (cell.value, cell.number_format, fill, bool(cell.font.b))
+
+
+def compare_workbooks(expected, actual, limit=10):
+    """Beda cell per cell (value, number format, fill, bold) antara dua workbook xlsx."""
+    wb_expected = openpyxl.load_workbook(BytesIO(expected))
+    wb_actual = openpyxl.load_workbook(BytesIO(actual))
+    if wb_expected.sheetnames != wb_actual.sheetnames:
+        return [f"sheets: {wb_expected.sheetnames} != {wb_actual.sheetnames}"]
+
+    diffs = []
+    for name in wb_expected.sheetnames:
+        ws_expected, ws_actual = wb_expected[name], wb_actual[name]
+        n_rows = max(ws_expected.max_row, ws_actual.max_row)
+        n_cols = max(ws_expected.max_column, ws_actual.max_column)
+        for r in range(1, n_rows + 1):
+            for c in range(1, n_cols + 1):
+                old = cell_signature(ws_expected.cell(r, c))
+                new = cell_signature(ws_actual.cell(r, c))
+                if old != new:
+                    diffs.append(f"{name}!{ws_expected.cell(r, c).coordinate}: {old} != {new}")
+                    if len(diffs) >= limit:
+                        return diffs
+    return diffs
+
+
+def check_equivalent(label, sheets, df_dict, new_bytes=None, old_bytes=None):
+    new_bytes = new_bytes or generate_multi_sheet_excel(sheets, df_dict)
+    old_bytes = old_bytes or legacy_generate_multi_sheet_excel(sheets, df_dict)
+    diffs = compare_workbooks(old_bytes, new_bytes)
+    if diffs:
+        print(f"equivalence: {label} DIFFERS from legacy", file=sys.stderr)
+        for diff in diffs:
+            print(f"  {diff}", file=sys.stderr)
+        return False
+    print(f"equivalence: {label} identical to legacy")
+    return True
+
+
+def legacy_generate_multi_sheet_excel(selected_sheets, df_dict):
+    # salinan loop per-cell sebelum engine vectorized, sebagai pembanding
+    output = BytesIO()
+
+    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
+        for sheet in selected_sheets:
+            df_raw = df_dict[sheet].copy()
+
+            df = df_raw.copy()
+            numeric_cols = []
+
+            for col in df.columns:
+                coerced = pd.to_numeric(df[col], errors="coerce")
+                if coerced.notna().any():
+                    df[col] = coerced
+                    numeric_cols.append(col)
+
+            pct_cols = [c for c in df.columns if "%" in c]
+
+            df.to_excel(writer, index=False, sheet_name=sheet)
+            workbook = writer.book
+            worksheet = writer.sheets[sheet]
+
+            fmt_rupiah = workbook.add_format({"num_format": "#,##0"})
+            fmt_pct = workbook.add_format({'num_format': '#,##0.0"%"'})
+            fmt_total = workbook.add_format({
+                "bold": True, "bg_color": "#D9EAD3", "font_color": "#1A5E20", "num_format": "#,##0"
+            })
+            fmt_first = workbook.add_format({"bg_color": "#C6EFCE", "num_format": "#,##0"})
+            fmt_second = workbook.add_format({"bg_color": "#FFEB9C", "num_format": "#,##0"})
+
+            for col_idx, col_name in enumerate(df.columns):
+                if col_name in numeric_cols:
+                    worksheet.set_column(col_idx, col_idx, 15, fmt_rupiah)
+                if col_name in pct_cols:
+                    worksheet.set_column(col_idx, col_idx, 15, fmt_pct)
+
+            for row_idx, row in enumerate(df.itertuples(index=False), start=1):
+                is_total_row = any(
+                    isinstance(x, str) and x.strip().upper() == "TOTAL"
+                    for x in row
+                    if pd.notna(x)
+                )
+
+                first_idx = second_idx = None
+                if sheet == "Bid & Price Analysis":
+                    first_vendor = row[df.columns.get_loc("1st Vendor")]
+                    second_vendor = row[df.columns.get_loc("2nd Vendor")]
+                    if first_vendor in numeric_cols:
+                        first_idx = df.columns.get_loc(first_vendor)
+                    if second_vendor in numeric_cols:
+                        second_idx = df.columns.get_loc(second_vendor)
+
+                for col_idx, col_name in enumerate(df.columns):
+                    value = row[col_idx]
+                    fmt = None
+
+                    if sheet == "Bid & Price Analysis":
+                        if col_idx == first_idx:
+                            fmt = fmt_first
+                        elif col_idx == second_idx:
+                            fmt = fmt_second
+                    elif is_total_row:
+                        fmt = fmt_total
+
+                    if pd.isna(value) or (isinstance(value, float) and np.isinf(value)):
+                        worksheet.write_blank(row_idx, col_idx, None, fmt)
+                    elif col_name in pct_cols:
+                        worksheet.write_number(row_idx, col_idx, value, fmt or fmt_pct)
+                    elif col_name in numeric_cols:
+                        worksheet.write_number(row_idx, col_idx, value, fmt or fmt_rupiah)
+                    else:
+                        worksheet.write(row_idx, col_idx, value, fmt)
+
+            for i, col in enumerate(df.columns):
+                worksheet.set_column(
+                    i, i,
+                    max(len(str(col)), df[col].astype(str).map(len).max()) + 2
+                )
+
+    output.seek(0)
+    return output.getvalue()
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=6)
+    parser.add_argument("--vendors", type=int, default=40)
+    parser.add_argument("--scopes", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    df_dict = make_dataframes(args.rounds, args.vendors, args.scopes)
+    sheets = list(df_dict)
+    cells = sum(df.size for df in df_dict.values())
+    print(f"{args.rounds} rounds x {args.vendors} vendors x {args.scopes} scopes ({cells:,} cells), {os.cpu_count()} CPU")
+
+    new_s, new_bytes = timed(generate_multi_sheet_excel, sheets, df_dict)
+    print(f"vectorized : {new_s:8.2f} s  ({len(new_bytes):,} bytes)")
+
+    serial_s, _ = timed(write_serial_workbook, BytesIO(), sheets, df_dict)
+    print(f"streaming  : {serial_s:8.2f} s  (1 process)")
+    parallel_s, _ = timed(write_parallel_workbook, BytesIO(), sheets, df_dict, None, args.workers)
+    print(f"parallel   : {parallel_s:8.2f} s  ({min(args.workers, len(sheets))} processes)")
+
+    if not args.skip_legacy:
+        old_s, old_bytes = timed(legacy_generate_multi_sheet_excel, sheets, df_dict)
+        print(f"legacy     : {old_s:8.2f} s  ({len(old_bytes):,} bytes)")
+        print(f"speedup    : {old_s / new_s:8.2f}x")
+
+        ok = check_equivalent("benchmark data", sheets, df_dict, new_bytes, old_bytes)
+        edge = edge_dataframes()
+        ok = check_equivalent("edge cases", list(edge), edge) and ok
+        if not ok:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Chart VISUALIZATION dari tabel analisis.
+
+Agregasi dikerjakan di pandas dulu, jadi spec Altair hanya membawa beberapa
+puluh baris (bukan data mentah) dan tidak kena batas 5.000 baris Altair.
+Altair (import ~0,5 s) baru di-import saat chart dibuat, bukan saat start.
+"""
+import pandas as pd
+
+from analysis import TREND_LABELS
+
+
+def vendor_columns(df_analysis):
+    # kolom harga vendor = kolom numeric sebelum "1st Lowest" (setelah ROUND & label)
+    before_stats = df_analysis.columns[:df_analysis.columns.get_loc("1st Lowest")]
+    return [col for col in before_stats if pd.api.types.is_numeric_dtype(df_analysis[col].dtype)]
+
+
+def wins_per_round(df_analysis, vendors=None):
+    """Jumlah scope yang dimenangkan (1st Vendor) tiap vendor per round, termasuk 0.
+
+    Vendor diambil dari kolom harga, jadi vendor yang tidak pernah menang tetap
+    muncul (dengan 0) di chart.
+    """
+    wins = df_analysis.groupby(["ROUND", "1st Vendor"], sort=False, observed=True).size()
+
+    rounds = pd.unique(df_analysis["ROUND"].dropna())
+    if vendors is None:
+        vendors = vendor_columns(df_analysis)
+    full = pd.MultiIndex.from_product([rounds, vendors], names=["ROUND", "VENDOR"])
+
+    wins.index = wins.index.set_names(["ROUND", "VENDOR"])
+    return wins.reindex(full, fill_value=0).rename("Wins").reset_index()
+
+
+def trend_counts(df_pmove):
+    """Jumlah scope per PRICE TREND untuk tiap vendor (baris TOTAL tidak dihitung)."""
+    trends = df_pmove.dropna(subset=["PRICE TREND"])
+    counts = trends.groupby(["VENDOR", "PRICE TREND"], sort=False, observed=True).size()
+    return counts.rename("Count").reset_index()
+
+
+def wins_chart(wins):
+    import altair as alt
+
+    rounds = list(pd.unique(wins["ROUND"]))
+    return (
+        alt.Chart(wins)
+        .mark_bar()
+        .encode(
+            x=alt.X("ROUND:N", sort=rounds, title="Round"),
+            xOffset=alt.XOffset("VENDOR:N"),
+            y=alt.Y("Wins:Q", title="Wins", axis=alt.Axis(tickMinStep=1)),
+            color=alt.Color("VENDOR:N", title="Vendor"),
+            tooltip=["ROUND", "VENDOR", "Wins"],
+        )
+    )
+
+
+def trend_chart(counts):
+    import altair as alt
+
+    return (
+        alt.Chart(counts)
+        .mark_bar()
+        .encode(
+            x=alt.X("VENDOR:N", title="Vendor"),
+            xOffset=alt.XOffset("PRICE TREND:N", sort=TREND_LABELS),
+            y=alt.Y("Count:Q", title="Scopes", axis=alt.Axis(tickMinStep=1)),
+            color=alt.Color("PRICE TREND:N", sort=TREND_LABELS, title="Price Trend"),
+            tooltip=["VENDOR", "PRICE TREND", "Count"],
+        )
+    )
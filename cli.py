@@ -0,0 +1,76 @@
+"""UPL Comparison Round by Round tanpa Streamlit (batch / cron).
+
+Setiap folder tender berisi file ROUND (satu file per round, satu sheet per
+vendor). Hasilnya workbook yang sama dengan Super Button:
+
+    python cli.py tenders/ABC tenders/XYZ
+    python cli.py tenders/ABC -o out/ABC.xlsx --sheets "Pivot Table" "Bid & Price Analysis"
+
+Default output: ``<folder> - UPL Comparison Round by Round.xlsx`` di samping
+folder-nya (bukan di dalam, supaya tidak ikut terbaca sebagai file ROUND).
+Modul ini sengaja tidak meng-import streamlit.
+"""
+import argparse
+import os
+import sys
+import time
+
+from parse_cache import ParsedSheetCache
+from pipeline import OUTPUT_SUFFIX, TABLES, analyze_rounds, round_files
+from super_button import save_multi_sheet_excel
+
+
+def default_output(directory):
+    # abspath: "." -> "../<nama folder> - ...", bukan file di dalam folder tender
+    return os.path.abspath(directory) + OUTPUT_SUFFIX
+
+
+def compare_tender(directory, output=None, sheets=TABLES, max_workers=None, parse_cache=None, parallel_export=None):
+    """Analisis satu folder tender dan tulis workbook-nya; return path output."""
+    paths = round_files(directory)
+    if not paths:
+        raise ValueError("tidak ada file ROUND (.xlsx / .xls)")
+
+    tables = analyze_rounds(paths, max_workers=max_workers, parse_cache=parse_cache, cache=None)
+    output = output or default_output(directory)
+    save_multi_sheet_excel(output, list(sheets), tables, parallel=parallel_export)
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directories", nargs="+", help="folder tender berisi file ROUND")
+    parser.add_argument("-o", "--output", help="path output (hanya untuk satu folder)")
+    parser.add_argument("--sheets", nargs="+", choices=TABLES, default=TABLES, help="sheet & urutannya")
+    parser.add_argument("--workers", type=int, default=None, help="process untuk parsing (1 = serial)")
+    parser.add_argument("--parse-cache", metavar="DIR", help="cache hasil parsing (Parquet) antar run")
+    parser.add_argument(
+        "--parallel-export", action="store_true", default=None,
+        help="export besar ditulis satu sheet per proses (butuh memory ekstra sebesar data)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.output and len(args.directories) > 1:
+        parser.error("--output hanya bisa dipakai untuk satu folder")
+
+    parse_cache = ParsedSheetCache(args.parse_cache) if args.parse_cache else None
+
+    failed = 0
+    for directory in args.directories:
+        start = time.perf_counter()
+        try:
+            output = compare_tender(
+                directory, args.output, args.sheets, args.workers, parse_cache, args.parallel_export
+            )
+        except Exception as e:
+            # file korup (BadZipFile, ...) hanya menggagalkan folder ini, folder lain tetap jalan
+            failed += 1
+            print(f"[FAILED] {directory}: {type(e).__name__}: {e}", file=sys.stderr)
+            continue
+        print(f"[OK] {directory} -> {output} ({time.perf_counter() - start:.2f} s)")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
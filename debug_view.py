@@ -0,0 +1,47 @@
+"""Sidebar debug: timing per stage untuk rerun ini + toggle cProfile.
+
+Aktif kalau env ``UPL_DEBUG=1`` atau URL berisi ``?debug=1``. Tanpa mode
+debug, record stage tetap ditulis ke log ``upl.profile`` (stderr server, satu
+baris JSON per rerun; ``UPL_PROFILE_LOG=DEBUG`` menambah satu baris per stage,
+``WARNING`` mematikannya) tapi sidebar tidak ditampilkan.
+"""
+import os
+
+import streamlit as st
+
+from profiling import RerunProfile, configure_profile_log
+
+CPROFILE_KEY = "debug_cprofile"
+
+# Streamlit hanya mengkonfigurasi logger "streamlit"; tanpa ini baris JSON hilang
+configure_profile_log()
+
+
+def debug_enabled():
+    return os.environ.get("UPL_DEBUG") == "1" or st.query_params.get("debug") == "1"
+
+
+def start_rerun_profile():
+    """Panggil di awal script; cProfile hanya jalan kalau toggle-nya dicentang."""
+    cprofile = debug_enabled() and st.session_state.get(CPROFILE_KEY, False)
+    return RerunProfile(cprofile=cprofile).start()
+
+
+def debug_sidebar(profile):
+    """Panggil di akhir script: tutup profile rerun dan tampilkan hasilnya."""
+    profile.stop()
+    if not debug_enabled():
+        return
+
+    with st.sidebar:
+        st.markdown("#### 🐞 Debug")
+        st.caption(f"Rerun: {profile.seconds:.3f} s")
+        st.dataframe(profile.table(), hide_index=True)
+
+        # berlaku mulai rerun berikutnya (toggle sendiri memicu rerun)
+        st.toggle("cProfile each rerun", key=CPROFILE_KEY)
+        stats = profile.stats_text()
+        if stats:
+            with st.expander("cProfile (cumulative)"):
+                st.code(stats, language=None)
+            st.download_button("Download profile", data=stats, file_name="rerun_profile.txt", mime="text/plain")
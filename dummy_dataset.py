@@ -0,0 +1,68 @@
+import io
+import json
+import os
+import zipfile
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Path file Excel yang sudah ada
+DUMMY_FILES = ["Round 1.xlsx", "Round 2.xlsx", "Round 3.xlsx", "Round 4.xlsx"]
+
+# ZIP prebuilt (opsional) supaya cold start tidak perlu baca 4 file xlsx lagi
+PREBUILT_ZIP = os.path.join(BASE_DIR, ".cache", "dummy_dataset.zip")
+
+
+def dataset_fingerprint(file_paths=DUMMY_FILES):
+    # (nama, mtime, size) -> cache otomatis invalid kalau file di disk berubah
+    fingerprint = []
+    for file_path in file_paths:
+        stat = os.stat(os.path.join(BASE_DIR, file_path))
+        fingerprint.append((file_path, stat.st_mtime_ns, stat.st_size))
+    return tuple(fingerprint)
+
+
+def fingerprint_comment(fingerprint):
+    # fingerprint disimpan sebagai komentar ZIP -> ikut atomic bersama isi ZIP-nya
+    return json.dumps(fingerprint).encode()
+
+
+def read_prebuilt_zip(fingerprint, prebuilt_path=PREBUILT_ZIP):
+    # hanya dipakai kalau dibuat dari file yang persis sama (nama, mtime, size)
+    try:
+        with open(prebuilt_path, "rb") as f:
+            data = f.read()
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            comment = zf.comment
+    except (OSError, zipfile.BadZipFile):
+        return None
+    if comment != fingerprint_comment(fingerprint):
+        return None
+    return data
+
+
+def build_dummy_zip(fingerprint, prebuilt_path=PREBUILT_ZIP):
+    """Bytes ZIP dummy dataset untuk fingerprint tertentu."""
+    data = read_prebuilt_zip(fingerprint, prebuilt_path)
+    if data is not None:
+        return data
+
+    # Buat ZIP di memory
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w") as zf:
+        zf.comment = fingerprint_comment(fingerprint)
+        for file_path, _, _ in fingerprint:
+            zf.write(os.path.join(BASE_DIR, file_path), arcname=file_path.split("/")[-1])  # arcname = nama file di ZIP
+    data = zip_buffer.getvalue()
+
+    # simpan untuk cold start berikutnya; gagal tulis (read-only fs) tidak masalah
+    if prebuilt_path:
+        try:
+            os.makedirs(os.path.dirname(prebuilt_path), exist_ok=True)
+            tmp_path = f"{prebuilt_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, prebuilt_path)
+        except OSError:
+            pass
+
+    return data
@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+
+
+def format_rupiah(x):
+    if pd.isna(x):
+        return ""
+    # pastikan bisa diubah ke float
+    try:
+        x = float(x)
+    except:
+        return x  # biarin apa adanya kalau bukan angka
+    return rupiah_text(x)
+
+
+def rupiah_text(x):
+    # x sudah float (bukan NaN)
+    # kalau tidak punya desimal (misal 7000.0), tampilkan tanpa ,00
+    if x.is_integer():
+        formatted = f"{int(x):,}".replace(",", ".")
+    else:
+        formatted = f"{x:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        # hapus ,00 kalau desimalnya 0 semua (misal 7000,00 → 7000)
+        if formatted.endswith(",00"):
+            formatted = formatted[:-3]
+    return formatted
+
+
+def rupiah_texts(values):
+    """rupiah_text untuk array float (tanpa NaN) sekaligus."""
+    x = np.asarray(values, dtype=np.float64)
+    is_int = np.isfinite(x) & (x == np.trunc(x))
+    texts = np.empty(len(x), dtype=object)
+    texts[is_int] = [f"{int(v):,}".replace(",", ".") for v in x[is_int].tolist()]
+    fractional = [f"{v:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".") for v in x[~is_int].tolist()]
+    # hapus ,00 kalau desimalnya 0 semua setelah pembulatan (misal 7000,00 -> 7000)
+    texts[~is_int] = [t[:-3] if t.endswith(",00") else t for t in fractional]
+    return texts
+
+
+def format_rupiah_column(values):
+    """format_rupiah untuk satu kolom sekaligus (hasil sama persis per cell).
+
+    Harga di tabel UPL banyak yang berulang, jadi yang diformat hanya nilai
+    unik-nya (pd.factorize), lalu hasilnya disebar lagi lewat index.
+    """
+    s = pd.Series(values, copy=False)
+    numeric = pd.to_numeric(s, errors="coerce")
+
+    out = s.to_numpy(dtype=object, copy=True)
+    out[s.isna().to_numpy()] = ""
+
+    is_num = numeric.notna().to_numpy()
+    if is_num.any():
+        codes, uniques = pd.factorize(numeric.to_numpy(dtype=np.float64, na_value=np.nan)[is_num])
+        out[is_num] = rupiah_texts(uniques)[codes]
+
+    return pd.Series(out, index=s.index)
+
+
+def rupiah_formatter(values):
+    """Formatter untuk Styler.format dari kolom yang sudah diformat sekaligus.
+
+    Styler tetap memanggil formatter per cell, tapi isinya hanya lookup dict
+    ke string yang sudah jadi, bukan parsing float + replace berulang.
+    """
+    s = pd.Series(values, copy=False).dropna().drop_duplicates()
+    lookup = dict(zip(s.to_numpy(dtype=object), format_rupiah_column(s).to_numpy()))
+
+    def formatter(x):
+        text = lookup.get(x)
+        if text is not None:
+            return text
+        return "" if pd.isna(x) else format_rupiah(x)
+
+    return formatter
+
+
+def rupiah_formatters(df, columns):
+    """{kolom: formatter} siap dipakai di Styler.format.
+
+    Semua kolom berbagi satu lookup: harga yang sama di vendor / round lain
+    diformat sekali, dan overhead pandas per kolom tidak terulang.
+    """
+    if not columns:
+        return {}
+    formatter = rupiah_formatter(pd.concat([df[col] for col in columns], ignore_index=True))
+    return {col: formatter for col in columns}
+
+
+# ===== STYLE MATRIX =====
+TOTAL_STYLE = "font-weight: bold; background-color: #D9EAD3; color: #1A5E20;"
+FIRST_STYLE = "background-color: #C6EFCE; color: #006100;"
+SECOND_STYLE = "background-color: #FFEB9C; color: #9C6500;"
+RED_TOTAL_STYLE = "background-color: #FFE5E5; color: #D00000; font-weight: 700;"
+
+
+def is_label_column(s):
+    return (
+        s.dtype == object
+        or isinstance(s.dtype, pd.CategoricalDtype)
+        or pd.api.types.is_string_dtype(s.dtype)
+    )
+
+
+def total_mask(df):
+    """Mask baris TOTAL: ada cell di kolom label yang isinya "TOTAL" (case-insensitive)."""
+    mask = np.zeros(len(df), dtype=bool)
+    for i in range(df.shape[1]):
+        s = df.iloc[:, i]
+        if not is_label_column(s):
+            continue
+        # astype("string"): kolom object tanpa teks (mis. [1, 2, None]) tetap punya .str
+        hit = s.astype("string").str.strip().str.upper().eq("TOTAL")
+        mask |= hit.fillna(False).to_numpy(dtype=bool)
+    return mask
+
+
+def total_styles(df, style=TOTAL_STYLE):
+    """Matrix CSS untuk Styler.apply(axis=None): seluruh baris TOTAL di-highlight."""
+    mask = total_mask(df)
+    styles = np.where(mask[:, None], style, "")
+    return pd.DataFrame(np.broadcast_to(styles, df.shape), index=df.index, columns=df.columns)
+
+
+def vendor_styles(df, first_col="1st Vendor", second_col="2nd Vendor"):
+    """Matrix CSS: cell harga vendor 1st (hijau) & 2nd (kuning) lowest per baris."""
+    columns = np.array(df.columns, dtype=object)[None, :]
+    styles = np.full(df.shape, "", dtype=object)
+
+    if first_col in df.columns:
+        first = columns == df[first_col].to_numpy(dtype=object)[:, None]
+    else:
+        first = np.zeros(df.shape, dtype=bool)
+    if second_col in df.columns:
+        second = (columns == df[second_col].to_numpy(dtype=object)[:, None]) & ~first
+    else:
+        second = np.zeros(df.shape, dtype=bool)
+
+    styles[first] = FIRST_STYLE
+    styles[second] = SECOND_STYLE
+    return pd.DataFrame(styles, index=df.index, columns=df.columns)
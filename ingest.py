@@ -0,0 +1,294 @@
+"""Ingestion file ROUND: satu file per round, satu sheet per vendor.
+
+Setiap sheet berisi floating table dengan kolom non-numeric di depan dan satu
+kolom numeric (PRICE) di paling akhir. Hasil akhirnya adalah merge data
+ROUND / VENDOR / <kolom non-numeric> / PRICE, lengkap dengan TOTAL row per
+vendor.
+"""
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from contextlib import closing
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from parse_cache import content_hash
+
+# di bawah jumlah file ini overhead process pool lebih mahal dari parsing-nya
+PARALLEL_MIN_FILES = 2
+
+# naikkan setiap kali hasil parsing berubah (detect_table, extract_table, parse_file):
+# key cache Parquet ikut berubah, jadi hasil parser lama tidak dipakai lagi
+PARSER_VERSION = 1
+
+# angka terakhir di nama round: "L2R4" -> ("L2R", 4), "Round 10" -> ("Round ", 10)
+ROUND_NUMBER = re.compile(r"^(.*?)(\d+)\D*$")
+
+
+def read_source(source):
+    """(nama file, bytes) dari path, file upload Streamlit, atau tuple yang sudah dibaca."""
+    if isinstance(source, tuple):
+        return source
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return os.path.basename(source), f.read()
+    if hasattr(source, "getvalue"):
+        return source.name, source.getvalue()
+    return os.path.basename(source.name), source.read()
+
+
+def round_label(file_name):
+    # "Round 1.xlsx" -> "Round 1"
+    return os.path.splitext(os.path.basename(file_name))[0]
+
+
+@lru_cache(maxsize=None)
+def round_key(file_name):
+    """Key natural sort untuk nama file / label round: (prefix, nomor, label).
+
+    "Round 2" < "Round 10" (bukan urutan string). Nama tanpa angka diurutkan
+    berdasarkan prefix-nya saja (nomor -1).
+    """
+    label = round_label(file_name)
+    match = ROUND_NUMBER.match(label)
+    if match is None:
+        return label.casefold(), -1, label
+    return match.group(1).casefold(), int(match.group(2)), label
+
+
+def sort_rounds(files):
+    # [(nama file, bytes)] dalam urutan round
+    return sorted(files, key=lambda file: round_key(file[0]))
+
+
+def iter_workbook_sheets(file_name, content):
+    """(nama sheet, iterator baris) untuk setiap sheet; workbook dibuka sekali per file."""
+    if file_name.lower().endswith(".xls"):
+        # .xls lewat pandas + xlrd; semua sheet dibaca dalam satu kali buka
+        sheets = pd.read_excel(BytesIO(content), sheet_name=None, header=None, dtype=object)
+        for sheet, raw in sheets.items():
+            yield sheet, (tuple(None if pd.isna(v) else v for v in row) for row in raw.itertuples(index=False))
+        return
+
+    import openpyxl  # di-import saat parsing saja (tidak ikut cold start app)
+
+    # read_only: shared strings di-parse sekali, XML tiap sheet di-stream baris demi baris
+    wb = openpyxl.load_workbook(BytesIO(content), read_only=True, data_only=True)
+    try:
+        for sheet in wb.sheetnames:
+            yield sheet, wb[sheet].iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def is_empty(value):
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def detect_table(rows):
+    """Cari floating table dalam satu kali jalan.
+
+    Header = baris non-kosong pertama; kolom tabel = dari cell non-kosong
+    pertama sampai terakhir di header. Pembacaan berhenti di baris kosong
+    pertama setelah header, jadi ribuan baris kosong ber-format di bawah
+    tabel tidak ikut dibaca.
+
+    Return ``(bounds, header, data)`` dengan ``bounds`` = (first_row,
+    first_col, last_row, last_col) 0-based inklusif, atau ``None`` kalau
+    sheet kosong.
+    """
+    header = None
+    data = []
+
+    for row_idx, row in enumerate(rows):
+        if header is None:
+            filled = [i for i, v in enumerate(row) if not is_empty(v)]
+            if not filled:
+                continue
+            header_row, first_col, last_col = row_idx, filled[0], filled[-1]
+            header = row[first_col:last_col + 1]
+            width = len(header)
+            continue
+
+        cells = row[first_col:last_col + 1]
+        if all(is_empty(v) for v in cells):
+            break
+        data.append(tuple(cells) + (None,) * (width - len(cells)))
+
+    if header is None:
+        return None
+
+    bounds = (header_row, first_col, header_row + len(data), last_col)
+    return bounds, header, data
+
+
+def extract_table(header, data, file_name="", sheet=""):
+    """Header + baris data floating table -> DataFrame."""
+    columns = [str(v).strip() if not is_empty(v) else f"Unnamed: {i}" for i, v in enumerate(header)]
+    df = pd.DataFrame(data, columns=columns)
+
+    if df.shape[1] < 2:
+        raise ValueError(
+            f"{file_name} / {sheet}: tabel harus punya kolom non-numeric dan satu kolom PRICE di akhir"
+        )
+
+    price_col = df.columns[-1]
+    price = pd.to_numeric(df[price_col], errors="coerce")
+    if price.notna().sum() == 0:
+        raise ValueError(f"{file_name} / {sheet}: kolom terakhir ({price_col}) harus numeric")
+    df[price_col] = price.astype(float)
+
+    return df
+
+
+def parse_file(task):
+    """Worker: parse semua sheet vendor di satu file ROUND (dipanggil di process pool)."""
+    file_name, content = task
+    parsed = []
+    # closing(): workbook langsung ditutup walau ada sheet yang gagal
+    with closing(iter_workbook_sheets(file_name, content)) as sheets:
+        for sheet, rows in sheets:
+            # detect_table berhenti lebih awal -> stream XML sheet ditutup di sini
+            with closing(rows):
+                found = detect_table(rows)
+            if found is None:
+                raise ValueError(f"{file_name} / {sheet}: sheet kosong, tidak ada tabel")
+
+            _, header, data = found
+            parsed.append((file_name, sheet, extract_table(header, data, file_name, sheet)))
+    return parsed
+
+
+def add_total_row(df, label_cols, price_col):
+    total = {col: np.nan for col in df.columns}
+    total.update({"ROUND": df["ROUND"].iat[0], "VENDOR": df["VENDOR"].iat[0]})
+    total[label_cols[0]] = "TOTAL"
+    total[price_col] = df[price_col].sum()
+    return pd.concat([df, pd.DataFrame([total])], ignore_index=True)
+
+
+def merge_tables(parsed):
+    """[(file_name, sheet, df)] -> merge data dengan TOTAL row tiap vendor."""
+    columns = None
+    frames = []
+
+    for file_name, sheet, df in parsed:
+        if columns is None:
+            columns = list(df.columns)
+        elif list(df.columns) != columns:
+            raise ValueError(
+                f"{file_name} / {sheet}: struktur tabel berbeda, "
+                f"kolom {list(df.columns)} != {columns}"
+            )
+
+        df = df.copy()
+        df.insert(0, "VENDOR", sheet)
+        df.insert(0, "ROUND", round_label(file_name))
+        frames.append(add_total_row(df, columns[:-1], columns[-1]))
+
+    if not frames:
+        raise ValueError("Tidak ada file ROUND yang diupload")
+
+    return compact_merge(pd.concat(frames, ignore_index=True))
+
+
+def compact_merge(merged):
+    """Representasi ringkas merge data: kolom label jadi categorical.
+
+    ROUND, VENDOR dan kolom label (Scope, Desc, ...) disimpan sebagai kode
+    integer + kamus bersama, jadi string tidak diulang di setiap baris dan
+    groupby/pivot cukup hash kode-nya. Urutan kategori = urutan kemunculan,
+    kecuali ROUND: ordered dengan urutan natural (round_key), jadi urutan
+    round ditetapkan sekali di sini. PRICE float64.
+    """
+    merged = merged.copy(deep=False)
+    price_col = merged.columns[-1]
+
+    for col in merged.columns[:-1]:
+        values = merged[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            continue
+        categories = pd.unique(values.dropna())
+        if col == "ROUND":
+            categories = sorted(categories, key=round_key)
+        merged[col] = pd.Categorical(values, categories=categories, ordered=(col == "ROUND"))
+
+    merged[price_col] = merged[price_col].astype(np.float64)
+    return merged
+
+
+def append_merge(merged, new):
+    """Merge data ``merged`` + merge data round baru ``new`` (di-ingest terpisah).
+
+    Hasilnya sama dengan meng-ingest semua file sekaligus: kategori label
+    digabung dengan urutan kemunculan, ROUND tetap ordered natural.
+    """
+    if list(new.columns) != list(merged.columns):
+        raise ValueError(
+            f"struktur tabel berbeda, kolom {list(new.columns)[2:]} != {list(merged.columns)[2:]}"
+        )
+
+    columns = {}
+    for col in merged.columns[:-1]:
+        combined = union_categoricals([merged[col], new[col]], ignore_order=True)
+        if col == "ROUND":
+            combined = combined.set_categories(sorted(combined.categories, key=round_key)).as_ordered()
+        columns[col] = combined
+    price_col = merged.columns[-1]
+    columns[price_col] = np.concatenate([
+        merged[price_col].to_numpy(dtype=np.float64), new[price_col].to_numpy(dtype=np.float64)
+    ])
+    return pd.DataFrame(columns)
+
+
+def parsed_key(content):
+    # key ParsedSheetCache: versi parser + hash isi file
+    return f"v{PARSER_VERSION}-{content_hash(content)}"
+
+
+def ingest_rounds(sources, max_workers=None, cache=None):
+    """Baca semua file ROUND (path atau file upload) -> merge data.
+
+    Setiap file di-parse paralel di process pool karena parsing openpyxl
+    murni Python dan CPU-bound; satu task per file, jadi workbook (dan shared
+    strings-nya) hanya dibuka sekali. ``max_workers=1`` memaksa serial.
+    Kalau ``cache`` (``parse_cache.ParsedSheetCache``) diberikan, file yang
+    isinya sudah pernah di-parse diambil dari cache dan tidak dibaca ulang.
+    """
+    files = sort_rounds(read_source(source) for source in sources)
+
+    parsed_by_file = [None] * len(files)
+    keys = [None] * len(files)
+    tasks, owners = [], []
+
+    for i, (file_name, content) in enumerate(files):
+        if cache is not None:
+            keys[i] = parsed_key(content)
+            cached = cache.get(keys[i])
+            if cached is not None:
+                parsed_by_file[i] = [(file_name, sheet, df) for sheet, df in cached]
+                continue
+
+        tasks.append((file_name, content))
+        owners.append(i)
+
+    if max_workers == 1 or len(tasks) < PARALLEL_MIN_FILES:
+        results = [parse_file(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(parse_file, tasks))
+
+    fresh = set()
+    for i, parsed in zip(owners, results):
+        parsed_by_file[i] = parsed
+        fresh.add(i)
+
+    if cache is not None:
+        for i in sorted(fresh):
+            cache.put(keys[i], [(sheet, df) for _, sheet, df in parsed_by_file[i]])
+
+    return merge_tables([item for parsed in parsed_by_file for item in parsed])
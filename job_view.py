@@ -0,0 +1,69 @@
+"""Panel Streamlit untuk PipelineJob: tombol run, progress per stage, cancel.
+
+Job disimpan di st.session_state[key]; selama job berjalan panel di-refresh
+lewat fragment (run_every), jadi script utama tidak ikut di-rerun.
+"""
+import streamlit as st
+
+from jobs import CANCELLED, DONE, FAILED, STAGES, PipelineJob
+from pipeline import server_parse_cache
+
+POLL_SECONDS = 0.5
+
+
+def stage_lines(job):
+    lines = []
+    for name in STAGES:
+        if name in job.timings:
+            lines.append(f"✅ {name} — {job.timings[name]:.2f} s")
+        elif name == job.stage and job.running:
+            lines.append(f"⏳ {name}")
+        else:
+            lines.append(f"▫️ {name}")
+    return "  \n".join(lines)
+
+
+def render_job(job, key, file_name):
+    if job.running:
+        st.progress(job.progress, text=f"Running: {job.stage or 'starting'}…")
+        st.markdown(stage_lines(job))
+        if st.button("Cancel", key=f"{key}_cancel"):
+            job.cancel()
+        return
+
+    if job.status == DONE:
+        st.success(f"Done in {sum(job.timings.values()):.2f} s")
+        st.markdown(stage_lines(job))
+        st.download_button(
+            label="Download result",
+            data=job.export,
+            file_name=file_name,
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            key=f"{key}_download",
+        )
+    elif job.status == CANCELLED:
+        st.warning("Cancelled.")
+    elif job.status == FAILED:
+        st.error(f"Failed: {job.error}")
+
+
+def job_panel(sources, key, label="Run analysis", file_name="UPL Comparison Round by Round.xlsx"):
+    """Tombol untuk menjalankan pipeline di background + status job di session ini."""
+    job = st.session_state.get(key)
+
+    if st.button(label, key=f"{key}_start", disabled=job is not None and job.running):
+        job = st.session_state[key] = PipelineJob(sources, parse_cache=server_parse_cache()).start()
+
+    if job is None:
+        return None
+
+    @st.fragment(run_every=POLL_SECONDS if job.running else None)
+    def panel():
+        was_running = job.running
+        render_job(job, key, file_name)
+        if was_running and not job.running:
+            # job selesai -> rerun penuh supaya polling berhenti
+            st.rerun()
+
+    panel()
+    return job
@@ -0,0 +1,131 @@
+"""Pipeline analisis sebagai background job.
+
+File ROUND -> merge -> pivot -> bid analysis -> movement analysis -> export
+dijalankan di thread pool, bukan di thread script Streamlit. Job menyimpan
+progress per stage dan bisa dibatalkan di antara stage; objek job disimpan
+di session_state, jadi rerun (widget berubah) cukup menempel lagi ke job
+yang sedang berjalan.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from arrow_tables import arrow_backed_tables
+from ingest import read_source, sort_rounds
+from pipeline import ANALYSIS_CACHE, ROUND_STATES, SERVER_MAX_WORKERS, TABLES, input_fingerprint, merge_rounds, pivot_rounds
+from profiling import profile_stage, result_rows
+from super_button import cached_multi_sheet_excel
+
+STAGES = ["Ingest & Merge", "Pivot Table", "Bid & Price Analysis", "Price Movement Analysis", "Export"]
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+# job dari semua session berbagi pool kecil ini; parsing di dalam job serial (SERVER_MAX_WORKERS)
+JOB_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="upl-job")
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class PipelineJob:
+    """Satu run pipeline untuk satu set file ROUND."""
+
+    def __init__(self, sources, max_workers=SERVER_MAX_WORKERS, parse_cache=None, cache=ANALYSIS_CACHE):
+        self.sources = list(sources)
+        self.max_workers = max_workers
+        self.parse_cache = parse_cache
+        self.cache = cache
+
+        self.status = PENDING
+        self.stage = None
+        self.timings = {}
+        self.tables = None
+        self.error = None
+        self._cancel = threading.Event()
+        self._future = None
+
+    @property
+    def running(self):
+        return self.status in (PENDING, RUNNING)
+
+    @property
+    def progress(self):
+        return len(self.timings) / len(STAGES)
+
+    def start(self, executor=JOB_EXECUTOR):
+        self._future = executor.submit(self._run)
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+        # belum sempat jalan -> langsung batal
+        if self._future is not None and self._future.cancel():
+            self.status = CANCELLED
+
+    def wait(self, timeout=None):
+        if self._future is not None:
+            self._future.exception(timeout)
+        return self
+
+    def export(self):
+        """Workbook Super Button dari hasil job (sudah di-cache saat stage Export)."""
+        return cached_multi_sheet_excel(TABLES, self.tables)
+
+    def _stage(self, name, func):
+        if self._cancel.is_set():
+            raise JobCancelled
+        self.stage = name
+        with profile_stage(name) as record:
+            result = func()
+            record["rows"] = result_rows(result)
+        self.timings[name] = record["seconds"]
+        return result
+
+    def _analyze(self, files):
+        # round yang sudah pernah dianalisis diambil dari ROUND_STATES
+        # setiap stage dicek cancel lebih dulu: ingest, lalu pivot (RoundComparison), lalu bid
+        merged, base = self._stage(
+            "Ingest & Merge",
+            lambda: merge_rounds(files, max_workers=self.max_workers, parse_cache=self.parse_cache),
+        )
+        pivot, comparison = self._stage("Pivot Table", lambda: pivot_rounds(merged, base))
+        tables = {
+            "Merge Data": merged,
+            "Pivot Table": pivot,
+            "Bid & Price Analysis": self._stage("Bid & Price Analysis", comparison.bid_price_analysis),
+            "Price Movement Analysis": self._stage("Price Movement Analysis", comparison.price_movement),
+        }
+        ROUND_STATES.put(input_fingerprint(files), merged, comparison)
+        return arrow_backed_tables(tables)
+
+    def _run(self):
+        self.status = RUNNING
+        try:
+            files = sort_rounds(read_source(source) for source in self.sources)
+            if self.cache is None:
+                tables = self._analyze(files)
+            else:
+                # get_or_compute: job lain / session lain dengan input sama menunggu hasil ini
+                tables = self.cache.get_or_compute(input_fingerprint(files), lambda: self._analyze(files))
+
+            # hasil analisis sudah ada di cache proses -> stage analisis dilewati, hanya export
+            self.timings.update({name: 0.0 for name in STAGES[:-1] if name not in self.timings})
+            self.tables = tables
+
+            self._stage("Export", self._warm_export)
+            self.stage = None
+            self.status = DONE
+        except JobCancelled:
+            self.status = CANCELLED
+        except Exception as e:
+            self.error = e
+            self.status = FAILED
+
+    def _warm_export(self):
+        workbook = self.export()
+        if hasattr(workbook, "close"):
+            workbook.close()
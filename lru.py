@@ -0,0 +1,115 @@
+"""LRU kecil yang aman antar thread, dipakai bersama oleh cache-cache proses.
+
+Dibatasi jumlah entry dan/atau total byte. ``get_or_compute`` memakai satu
+lock per key: thread lain dengan key sama menunggu hasilnya, bukan ikut
+menghitung, sementara key lain (termasuk cache hit) tetap jalan.
+"""
+import threading
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+def _identity(value):
+    return value
+
+
+class LRUCache:
+    """``max_entries`` / ``budget_bytes`` None = tidak dibatasi.
+
+    ``on_evict(value)`` dipanggil untuk entry yang dibuang (ter-evict atau
+    ``clear``). ``load(value)`` di ``get`` / ``get_or_compute`` dijalankan di
+    dalam lock, jadi entry tidak bisa ter-evict di tengah jalan.
+    """
+
+    def __init__(self, max_entries=None, budget_bytes=None, on_evict=None):
+        self.max_entries = max_entries
+        self.budget_bytes = budget_bytes
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()  # key -> (value, ukuran byte)
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def keys(self):
+        with self._lock:
+            return list(self._entries)
+
+    def get(self, key, default=None, load=_identity):
+        with self._lock:
+            return self._get(key, default, load)
+
+    def _get(self, key, default, load):
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        self._entries.move_to_end(key)
+        return load(entry[0])
+
+    def put(self, key, value, size=0, load=_identity):
+        """Simpan entry; return ``load(value)``.
+
+        Entry yang lebih besar dari ``budget_bytes`` tidak disimpan sama sekali.
+        """
+        with self._lock:
+            if self.budget_bytes is not None and size > self.budget_bytes:
+                return load(value)
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            self._evict()
+            return load(value)
+
+    def _evict(self):
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.budget_bytes is not None and self.nbytes > self.budget_bytes)
+        ):
+            _, (value, size) = self._entries.popitem(last=False)
+            self.nbytes -= size
+            self.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(value)
+
+    def get_or_compute(self, key, compute, size=None, load=_identity):
+        """Nilai untuk ``key``; kalau belum ada, ``compute()`` lalu simpan.
+
+        ``size(value)`` = ukuran byte entry (default 0).
+        """
+        with self._lock:
+            value = self._get(key, _MISSING, load)
+            if value is not _MISSING:
+                self.hits += 1
+                return value
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                with self._lock:
+                    value = self._get(key, _MISSING, load)
+                    if value is not _MISSING:
+                        self.hits += 1
+                        return value
+                    self.misses += 1
+                value = compute()
+                return self.put(key, value, size(value) if size is not None else 0, load)
+        finally:
+            # compute() boleh gagal / dibatalkan (job background) -> lock key tetap dibersihkan
+            with self._lock:
+                self._key_locks.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            values = [value for value, _ in self._entries.values()]
+            self._entries.clear()
+            self.nbytes = 0
+        if self.on_evict is not None:
+            for value in values:
+                self.on_evict(value)
@@ -0,0 +1,111 @@
+"""Cache hasil parsing file ROUND di disk (Parquet), key = versi parser + hash isi file.
+
+Tim negosiasi sering upload ulang file yang sama sambil menambah round baru;
+dengan cache ini hanya file yang belum pernah dilihat yang di-parse ulang.
+Setiap file disimpan sebagai satu folder ``<key>/`` berisi ``sheets.json``
+(urutan nama sheet) dan satu file Parquet per sheet vendor. Total ukuran
+dibatasi ``max_bytes``; folder yang paling lama tidak dipakai dibuang dulu,
+termasuk entry dari versi parser lama yang tidak pernah dibaca lagi.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(BASE_DIR, ".cache", "parsed_sheets")
+DEFAULT_MAX_BYTES = 512 * 2**20
+
+MANIFEST = "sheets.json"
+
+
+def content_hash(content):
+    return hashlib.sha256(content).hexdigest()
+
+
+def dir_size(path):
+    total = 0
+    for entry in os.scandir(path):
+        if entry.is_file():
+            total += entry.stat().st_size
+    return total
+
+
+class ParsedSheetCache:
+    """Store Parquet per file ROUND dengan batas ukuran + eviction LRU."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _entry_dir(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def get(self, key):
+        """[(sheet, df)] untuk hash file ini, atau None kalau belum ada."""
+        entry_dir = self._entry_dir(key)
+        try:
+            with open(os.path.join(entry_dir, MANIFEST), encoding="utf-8") as f:
+                sheets = json.load(f)
+            parsed = [
+                (sheet, pd.read_parquet(os.path.join(entry_dir, f"{i}.parquet")))
+                for i, sheet in enumerate(sheets)
+            ]
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        # mtime folder = waktu terakhir dipakai (untuk LRU)
+        try:
+            os.utime(entry_dir)
+        except OSError:
+            pass
+        self.hits += 1
+        return parsed
+
+    def put(self, key, parsed):
+        """Simpan [(sheet, df)]; gagal tulis (disk penuh, tipe campur) diabaikan."""
+        entry_dir = self._entry_dir(key)
+        if os.path.isdir(entry_dir):
+            return
+
+        tmp_dir = tempfile.mkdtemp(prefix=f".{key}.", dir=self.cache_dir)
+        try:
+            for i, (_, df) in enumerate(parsed):
+                df.to_parquet(os.path.join(tmp_dir, f"{i}.parquet"), index=False)
+            with open(os.path.join(tmp_dir, MANIFEST), "w", encoding="utf-8") as f:
+                json.dump([sheet for sheet, _ in parsed], f)
+            os.rename(tmp_dir, entry_dir)
+        except Exception:
+            # mis. kolom label berisi angka & teks campur -> tidak bisa jadi Parquet
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+
+        self.evict()
+
+    def evict(self):
+        with self._lock:
+            entries = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_dir() and not entry.name.startswith("."):
+                    entries.append((entry.stat().st_mtime, dir_size(entry.path), entry.path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+
+    def clear(self):
+        with self._lock:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            os.makedirs(self.cache_dir, exist_ok=True)
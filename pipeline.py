@@ -0,0 +1,210 @@
+"""Pipeline lengkap: file ROUND -> merge data -> pivot & analisis.
+
+Hasilnya di-cache per proses (dipakai bersama semua session Streamlit) dengan
+key fingerprint isi file input, jadi beberapa analis yang membuka tender yang
+sama tidak menghitung ulang merge, pivot, bid analysis dan movement analysis.
+State ``RoundComparison`` juga disimpan (``ROUND_STATES``, di dalam budget MB
+cache yang sama): kalau tender yang sama mendapat Round N+1, hanya file round
+baru yang di-ingest dan ditambahkan lewat ``add_round``.
+"""
+import functools
+import os
+
+from analysis import RoundComparison
+from arrow_tables import arrow_backed_tables
+from ingest import append_merge, ingest_rounds, read_source, round_key, sort_rounds
+from lru import LRUCache
+from parse_cache import DEFAULT_CACHE_DIR, ParsedSheetCache, content_hash
+from profiling import profiled
+
+TABLES = ["Merge Data", "Pivot Table", "Bid & Price Analysis", "Price Movement Analysis"]
+
+ROUND_EXTENSIONS = (".xlsx", ".xls")
+
+# nama workbook hasil CLI (<folder> + suffix); tidak pernah dibaca sebagai file ROUND
+OUTPUT_SUFFIX = " - UPL Comparison Round by Round.xlsx"
+
+DEFAULT_BUDGET_MB = float(os.environ.get("UPL_ANALYSIS_CACHE_MB", 1024))
+
+# parsing di dalam proses server Streamlit (background job, warm-up) selalu
+# serial: process pool tidak di-fork dari thread server yang sedang melayani session
+SERVER_MAX_WORKERS = 1
+
+# cache parsing (Parquet di disk) untuk job & warm-up di server; UPL_PARSE_CACHE_DIR="" mematikannya
+PARSE_CACHE_DIR = os.environ.get("UPL_PARSE_CACHE_DIR", DEFAULT_CACHE_DIR)
+
+def input_fingerprint(files):
+    # (nama file, hash isi) dalam urutan round -> nama file ikut menentukan ROUND
+    return tuple((file_name, content_hash(content)) for file_name, content in files)
+
+
+@functools.cache
+def server_parse_cache():
+    """ParsedSheetCache bersama untuk proses server, dibuat saat pertama dipakai."""
+    if not PARSE_CACHE_DIR:
+        return None
+    try:
+        return ParsedSheetCache(PARSE_CACHE_DIR)
+    except OSError:
+        # folder tidak bisa ditulis (deploy read-only) -> parsing tanpa cache
+        return None
+
+
+def round_files(directory):
+    """Path file ROUND di satu folder tender (urutan natural).
+
+    File lock Excel (~$...) dan workbook hasil CLI (OUTPUT_SUFFIX) dilewati.
+    """
+    paths = [
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.lower().endswith(ROUND_EXTENSIONS)
+        and not name.startswith("~$")
+        and not name.endswith(OUTPUT_SUFFIX)
+    ]
+    return sorted(paths, key=round_key)
+
+
+def tables_nbytes(tables):
+    return sum(int(df.memory_usage(index=True, deep=True).sum()) for df in tables.values())
+
+
+class AnalysisCache:
+    """LRU hasil analisis dengan batas memori (MB), aman dipakai antar thread.
+
+    DataFrame yang dikembalikan dipakai bersama semua session, jadi jangan
+    diubah in-place.
+    """
+
+    def __init__(self, budget_mb=DEFAULT_BUDGET_MB):
+        self._lru = LRUCache(budget_bytes=int(budget_mb * 2**20))
+
+    @property
+    def budget_bytes(self):
+        return self._lru.budget_bytes
+
+    @property
+    def nbytes(self):
+        return self._lru.nbytes
+
+    def stats(self):
+        # state RoundStates ikut tersimpan di LRU ini (key ("rounds", ...))
+        round_states = sum(1 for key in self._lru.keys() if key[0] == "rounds")
+        return {
+            "entries": len(self._lru) - round_states,
+            "round_states": round_states,
+            "hits": self._lru.hits,
+            "misses": self._lru.misses,
+            "evictions": self._lru.evictions,
+            "mb": self.nbytes / 2**20,
+            "budget_mb": self.budget_bytes / 2**20,
+        }
+
+    def get(self, key):
+        return self._lru.get(key)
+
+    def put(self, key, tables):
+        self._lru.put(key, tables, tables_nbytes(tables))
+
+    def get_or_compute(self, key, compute):
+        # satu lock per key: session lain dengan input sama menunggu, bukan ikut menghitung
+        return self._lru.get_or_compute(key, compute, size=tables_nbytes)
+
+    def clear(self):
+        self._lru.clear()
+
+
+ANALYSIS_CACHE = AnalysisCache()
+
+
+class RoundStates:
+    """(merge data, RoundComparison) per set file ROUND, untuk round berikutnya.
+
+    Disimpan di LRU ``AnalysisCache`` yang sama (key ``("rounds", fingerprint)``)
+    dan dihitung terhadap budget MB-nya, jadi budget itu membatasi keduanya.
+    State disimpan setelah semua tabel disusun dan tidak pernah diubah lagi;
+    round baru ditambahkan ke ``RoundComparison.copy()``.
+    """
+
+    def __init__(self, cache):
+        self._lru = cache._lru
+
+    def longest_prefix(self, key):
+        """(jumlah file, merge data, comparison) untuk prefix ``key`` terpanjang yang tersimpan."""
+        for n in range(len(key), 0, -1):
+            entry = self._lru.get(("rounds", key[:n]))
+            if entry is not None:
+                return (n,) + entry
+        return None
+
+    def put(self, key, merged, comparison):
+        size = tables_nbytes({"Merge Data": merged}) + comparison.nbytes()
+        self._lru.put(("rounds", key), (merged, comparison), size)
+
+
+ROUND_STATES = RoundStates(ANALYSIS_CACHE)
+
+
+def merge_rounds(files, max_workers=None, parse_cache=None, states=ROUND_STATES):
+    """[(nama file, bytes)] urut round -> (merge data, base untuk ``pivot_rounds``).
+
+    Kalau file-file awal sudah pernah dianalisis (ada di ``states``), hanya
+    file sisanya yang di-ingest lalu di-append ke merge data lama; ``base`` =
+    (jumlah baris merge data lama, RoundComparison lama). Tanpa state, None.
+    """
+    key = input_fingerprint(files)
+    found = states.longest_prefix(key) if states is not None else None
+    if found is None:
+        return ingest_rounds(files, max_workers=max_workers, cache=parse_cache), None
+
+    n, old_merged, old_comparison = found
+    merged = old_merged
+    if n < len(files):
+        new = ingest_rounds(files[n:], max_workers=max_workers, cache=parse_cache)
+        merged = append_merge(old_merged, new)
+    return merged, (len(old_merged), old_comparison)
+
+
+def pivot_rounds(merged, base=None):
+    """(Pivot Table, RoundComparison) dari hasil ``merge_rounds``.
+
+    Round yang sudah ada di ``base`` tidak diproses ulang; state lama tidak
+    diubah (round baru ditambahkan ke salinannya).
+    """
+    if base is None:
+        comparison = RoundComparison.from_merge(merged)
+    else:
+        start, comparison = base
+        if start < len(merged):
+            # baris round baru dari merge gabungan -> kategori label sama dengan full ingest
+            comparison = comparison.copy().add_merge(merged.iloc[start:])
+    return comparison.pivot(), comparison
+
+
+def run_analysis(files, max_workers=None, parse_cache=None, states=ROUND_STATES):
+    """[(nama file, bytes)] -> {nama tabel: DataFrame Arrow-backed}."""
+    # ingest (parsing + merge) diukur terpisah dari pivot/bid yang dihitung RoundComparison
+    merged, base = profiled("ingest")(merge_rounds)(files, max_workers, parse_cache, states)
+    pivot, comparison = profiled("pivot")(pivot_rounds)(merged, base)
+    tables = {
+        "Merge Data": merged,
+        "Pivot Table": pivot,
+        "Bid & Price Analysis": profiled("bid_analysis")(comparison.bid_price_analysis)(),
+        "Price Movement Analysis": profiled("movement_analysis")(comparison.price_movement)(),
+    }
+    if states is not None:
+        states.put(input_fingerprint(files), merged, comparison)
+    return arrow_backed_tables(tables)
+
+
+def analyze_rounds(sources, max_workers=None, parse_cache=None, cache=ANALYSIS_CACHE):
+    """Semua tabel untuk file ROUND ini, diambil dari cache kalau sudah ada."""
+    # urutan upload tidak mempengaruhi hasil -> tidak ikut fingerprint
+    files = sort_rounds(read_source(source) for source in sources)
+    if cache is None:
+        # tanpa cache proses (CLI / batch) -> state round juga tidak disimpan
+        return run_analysis(files, max_workers, parse_cache, states=None)
+    return cache.get_or_compute(
+        input_fingerprint(files),
+        lambda: run_analysis(files, max_workers, parse_cache),
+    )
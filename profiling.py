@@ -0,0 +1,150 @@
+"""Instrumentasi per stage: wall time, jumlah baris, dan delta memori (RSS).
+
+Stage dibungkus dengan ``profile_stage`` (context manager) atau ``profiled``
+(decorator). Record-nya masuk ke ``RerunProfile`` yang sedang aktif di thread
+ini (satu per rerun script Streamlit) dan selalu ditulis sebagai satu baris
+log JSON di logger ``upl.profile``: per rerun di level INFO, per stage di
+DEBUG. Logger itu baru keluar ke stderr setelah ``configure_profile_log``
+dipanggil (debug_view melakukannya; levelnya dari env ``UPL_PROFILE_LOG``).
+Tidak bergantung pada Streamlit.
+"""
+import contextvars
+import cProfile
+import functools
+import io
+import json
+import logging
+import os
+import pstats
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+logger = logging.getLogger("upl.profile")
+
+PROFILE_LOG_LEVEL = os.environ.get("UPL_PROFILE_LOG", "INFO").upper()
+
+_current = contextvars.ContextVar("upl_rerun_profile", default=None)
+
+
+def current_rss_mb():
+    # RSS proses saat ini (Linux); None kalau /proc tidak tersedia
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def configure_profile_log(level=PROFILE_LOG_LEVEL, stream=None):
+    """Tulis baris JSON ``upl.profile`` ke ``stream`` (default stderr).
+
+    Tanpa handler, logging memakai handler last-resort yang hanya meneruskan
+    WARNING ke atas, jadi record INFO/DEBUG hilang. Handler hanya dipasang
+    sekali; memanggil ulang cukup mengganti level.
+    """
+    if not logger.handlers:
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        # handler root (kalau dikonfigurasi) tidak ikut mencetak baris yang sama
+        logger.propagate = False
+    logger.setLevel(level)
+
+
+def result_rows(result):
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return len(result)
+    if isinstance(result, dict) and result and all(isinstance(v, pd.DataFrame) for v in result.values()):
+        return sum(len(v) for v in result.values())
+    if isinstance(result, tuple) and result and isinstance(result[0], pd.DataFrame):
+        # (tabel, state) -> baris tabel
+        return len(result[0])
+    return None
+
+
+@contextmanager
+def profile_stage(name, rows=None):
+    """Ukur satu stage; ``rows`` boleh diisi belakangan lewat record["rows"]."""
+    record = {"stage": name, "rows": rows}
+    rss_before = current_rss_mb()
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record["seconds"] = round(time.perf_counter() - start, 4)
+        rss_after = current_rss_mb()
+        record["rss_delta_mb"] = (
+            round(rss_after - rss_before, 2) if rss_before is not None and rss_after is not None else None
+        )
+
+        profile = _current.get()
+        if profile is not None:
+            profile.stages.append(record)
+        logger.debug(json.dumps({"event": "stage", **record}))
+
+
+def profiled(name):
+    """Decorator: ``profile_stage`` untuk seluruh fungsi, rows dari hasilnya."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile_stage(name) as record:
+                result = func(*args, **kwargs)
+                record["rows"] = result_rows(result)
+            return result
+        return wrapper
+    return decorate
+
+
+class RerunProfile:
+    """Kumpulan record stage untuk satu rerun, opsional dengan cProfile."""
+
+    def __init__(self, name="rerun", cprofile=False):
+        self.name = name
+        self.stages = []
+        self.seconds = None
+        self.profiler = cProfile.Profile() if cprofile else None
+        self._start = None
+        self._rss_start = None
+
+    def start(self):
+        _current.set(self)
+        self._rss_start = current_rss_mb()
+        self._start = time.perf_counter()
+        if self.profiler is not None:
+            try:
+                self.profiler.enable()
+            except ValueError:
+                # profiler lain sedang aktif (session lain) -> rerun ini tanpa cProfile
+                self.profiler = None
+        return self
+
+    def stop(self):
+        if self.profiler is not None:
+            self.profiler.disable()
+        self.seconds = time.perf_counter() - self._start
+        if _current.get() is self:
+            _current.set(None)
+
+        rss_end = current_rss_mb()
+        logger.info(json.dumps({
+            "event": self.name,
+            "seconds": round(self.seconds, 4),
+            "rss_mb": round(rss_end, 1) if rss_end is not None else None,
+            "rss_delta_mb": round(rss_end - self._rss_start, 2) if rss_end is not None else None,
+            "stages": self.stages,
+        }))
+        return self
+
+    def table(self):
+        return pd.DataFrame(self.stages, columns=["stage", "seconds", "rows", "rss_delta_mb"])
+
+    def stats_text(self, sort="cumulative", limit=40):
+        if self.profiler is None:
+            return ""
+        out = io.StringIO()
+        pstats.Stats(self.profiler, stream=out).sort_stats(sort).print_stats(limit)
+        return out.getvalue()
@@ -0,0 +1,523 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from formatting import total_mask
+from lru import LRUCache
+from profiling import profiled
+
+BID_SHEET = "Bid & Price Analysis"
+
+# Di atas jumlah baris ini export ditulis streaming (constant_memory) ke temp file
+STREAM_THRESHOLD_ROWS = 100_000
+STREAM_CHUNK_ROWS = 10_000
+
+# Export streaming paralel (satu sheet per proses) hanya kalau diminta
+# (UPL_PARALLEL_EXPORT=1 / CLI --parallel-export): setiap worker menerima
+# DataFrame sheet-nya utuh lewat pickle, jadi memory naik lagi sebesar data,
+# dan perakitannya bergantung pada API privat xlsxwriter (Format._get_xf_index)
+PARALLEL_EXPORT = os.environ.get("UPL_PARALLEL_EXPORT") == "1"
+PARALLEL_MIN_SHEETS = 2
+SHEET_PART = "xl/worksheets/sheet{}.xml"
+SHEET_HEAD_BYTES = 4096
+
+# Kode format per cell (dipakai sebagai mask per kolom)
+FMT_NONE, FMT_TOTAL, FMT_FIRST, FMT_SECOND = 0, 1, 2, 3
+
+# Header style bawaan pandas .to_excel() (bold + border tipis + center)
+HEADER_STYLE = {
+    "bold": True,
+    "top": 1,
+    "right": 1,
+    "bottom": 1,
+    "left": 1,
+    "align": "center",
+    "valign": "top",
+}
+
+
+def new_workbook(output, options=None):
+    # xlsxwriter baru di-import saat export pertama, tidak ikut cold start app
+    import xlsxwriter
+
+    return xlsxwriter.Workbook(output, options or {})
+
+
+def add_formats(workbook):
+    return {
+        "header": workbook.add_format(HEADER_STYLE),
+        "rupiah": workbook.add_format({"num_format": "#,##0"}),
+        "pct": workbook.add_format({"num_format": '#,##0.0"%"'}),
+        FMT_TOTAL: workbook.add_format({
+            "bold": True,
+            "bg_color": "#D9EAD3",
+            "font_color": "#1A5E20",
+            "num_format": "#,##0"
+        }),
+        FMT_FIRST: workbook.add_format({
+            "bg_color": "#C6EFCE",
+            "num_format": "#,##0"
+        }),
+        FMT_SECOND: workbook.add_format({
+            "bg_color": "#FFEB9C",
+            "num_format": "#,##0"
+        }),
+    }
+
+
+def pin_format_indices(formats):
+    # index XF dikunci dengan urutan tetap (bukan urutan pemakaian pertama),
+    # supaya sheet yang ditulis di proses lain merujuk ke style yang sama
+    for fmt in formats.values():
+        fmt._get_xf_index()
+    return formats
+
+
+def has_numbers(coerced):
+    # lewat numpy: teks yang gagal di-coerce di kolom ArrowDtype jadi NaN, bukan NA
+    return bool((~np.isnan(coerced.to_numpy(dtype=np.float64, na_value=np.nan))).any())
+
+
+def coerce_numeric(df_raw):
+    # kolom yang punya minimal satu angka dianggap numeric
+    # shallow copy: kolom yang di-coerce diganti, data asli tidak ikut tersalin
+    df = df_raw.copy(deep=False)
+    numeric_cols = []
+
+    for col in df.columns:
+        coerced = pd.to_numeric(df[col], errors="coerce")
+        if has_numbers(coerced):
+            df[col] = coerced
+            numeric_cols.append(col)
+
+    return df, numeric_cols
+
+
+def numeric_columns(df_raw, chunk_rows):
+    # sama seperti coerce_numeric, tapi dicek per chunk dan berhenti di angka pertama
+    n_rows = len(df_raw)
+    return [
+        col for i, col in enumerate(df_raw.columns)
+        if any(
+            has_numbers(pd.to_numeric(df_raw.iloc[start:start + chunk_rows, i], errors="coerce"))
+            for start in range(0, n_rows, chunk_rows)
+        )
+    ]
+
+
+def coerce_columns(df_raw, numeric_cols):
+    df = df_raw.copy(deep=False)
+    for col in numeric_cols:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df
+
+
+def vendor_col_index(df, label, numeric_cols):
+    # nama vendor di kolom "1st Vendor"/"2nd Vendor" -> index kolom harganya (-1 kalau tidak ada)
+    lookup = {name: df.columns.get_loc(name) for name in numeric_cols}
+    idx = df[label].map(lambda v: lookup.get(v, -1) if isinstance(v, str) else -1)
+    return idx.to_numpy(dtype=np.int64)
+
+
+def build_format_codes(df, sheet, numeric_cols):
+    """Matrix (rows x cols) berisi kode format highlight untuk setiap cell."""
+    n_rows, n_cols = df.shape
+    codes = np.zeros((n_rows, n_cols), dtype=np.int8)
+
+    if sheet == BID_SHEET:
+        first_idx = vendor_col_index(df, "1st Vendor", numeric_cols)
+        second_idx = vendor_col_index(df, "2nd Vendor", numeric_cols)
+        col_range = np.arange(n_cols)
+        codes[col_range == second_idx[:, None]] = FMT_SECOND
+        codes[col_range == first_idx[:, None]] = FMT_FIRST
+    else:
+        codes[total_mask(df)] = FMT_TOTAL
+
+    return codes
+
+
+def inf_text(value):
+    # sama seperti .to_excel(): inf ditulis sebagai teks, NaN dikosongkan
+    if isinstance(value, float) and np.isinf(value):
+        return "inf" if value > 0 else "-inf"
+    return None
+
+
+def default_format(col_name, numeric_cols, pct_cols, formats):
+    if col_name not in numeric_cols:
+        return None
+    return formats["pct"] if col_name in pct_cols else formats["rupiah"]
+
+
+def blank_mask(s, numeric):
+    if numeric:
+        return ~np.isfinite(s.to_numpy(dtype=np.float64))
+    return s.isna().to_numpy()
+
+
+def column_plan(df, col_name, numeric_cols, pct_cols, formats):
+    # mask cell kosong + format default untuk satu kolom
+    numeric = col_name in numeric_cols
+    return blank_mask(df[col_name], numeric), default_format(col_name, numeric_cols, pct_cols, formats)
+
+
+def write_cell(worksheet, row_idx, col_idx, value, code, blank, default_fmt, formats):
+    fmt = formats[code] if code != FMT_NONE else None
+
+    if blank:
+        if fmt is not None:
+            worksheet.write_blank(row_idx, col_idx, None, fmt)
+        else:
+            text = inf_text(value)
+            if text:
+                worksheet.write_string(row_idx, col_idx, text)
+    else:
+        worksheet.write(row_idx, col_idx, value, fmt or default_fmt)
+
+
+def write_column_runs(worksheet, col_idx, values, codes, blank, default_fmt, formats):
+    # tulis per blok baris yang formatnya sama, bukan per cell
+    key = codes.astype(np.int16) * 2 + blank
+    bounds = np.flatnonzero(np.diff(key)) + 1
+    starts = np.concatenate(([0], bounds))
+    ends = np.concatenate((bounds, [len(values)]))
+
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        code = int(codes[start])
+
+        if blank[start]:
+            for r in range(start, end):
+                write_cell(worksheet, r + 1, col_idx, values[r], code, True, default_fmt, formats)
+            continue
+
+        fmt = formats[code] if code != FMT_NONE else None
+        worksheet.write_column(start + 1, col_idx, values[start:end], fmt or default_fmt)
+
+
+def default_row_runs(default_fmts):
+    # kolom berurutan dengan format default yang sama -> satu write_row
+    runs = []
+    start = 0
+    for c in range(1, len(default_fmts) + 1):
+        if c == len(default_fmts) or default_fmts[c] is not default_fmts[start]:
+            runs.append((start, c, default_fmts[start]))
+            start = c
+    return runs
+
+
+def prepare_sheet(workbook, sheet, df_raw, formats):
+    df, numeric_cols = coerce_numeric(df_raw)
+    pct_cols = [c for c in df.columns if "%" in c]
+
+    worksheet = workbook.add_worksheet(sheet)
+    worksheet.write_row(0, 0, list(df.columns), formats["header"])
+
+    codes = build_format_codes(df, sheet, numeric_cols)
+    plans = [column_plan(df, col, numeric_cols, pct_cols, formats) for col in df.columns]
+
+    return worksheet, df, codes, plans
+
+
+def numeric_width(s, pct=False):
+    # lebar teks yang tampil di Excel ("#,##0" / '#,##0.0"%"'); cukup cek nilai
+    # terbesar & terkecil karena lebar naik seiring |nilai|
+    values = s.to_numpy(dtype=np.float64)
+    finite = values[np.isfinite(values)]
+    width = 4 if np.isinf(values).any() else 0  # inf ditulis sebagai teks "-inf"/"inf"
+    if finite.size:
+        for x in (finite.max(), finite.min()):
+            text = f"{x:,.1f}%" if pct else f"{round(x):,}"
+            width = max(width, len(text))
+    return width
+
+
+def label_width(s):
+    # kategori / nilai unik saja, bukan string copy seluruh kolom
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        values = s.cat.categories
+    else:
+        values = pd.unique(s.dropna())
+    if not len(values):
+        return 0
+    return int(pd.Series(values, dtype=object).map(str).str.len().max())
+
+
+def column_width(s, col):
+    if pd.api.types.is_numeric_dtype(s.dtype) and not pd.api.types.is_bool_dtype(s.dtype):
+        width = numeric_width(s, pct="%" in str(col))
+    else:
+        width = label_width(s)
+    return max(len(str(col)), width) + 2
+
+
+def autofit_columns(worksheet, widths):
+    for i, width in enumerate(widths):
+        worksheet.set_column(i, i, width)
+
+
+def write_sheet(workbook, sheet, df_raw, formats):
+    worksheet, df, codes, plans = prepare_sheet(workbook, sheet, df_raw, formats)
+
+    for col_idx, (blank, default_fmt) in enumerate(plans):
+        write_column_runs(
+            worksheet, col_idx, df.iloc[:, col_idx].tolist(), codes[:, col_idx],
+            blank, default_fmt, formats
+        )
+
+    # ===== AUTOFIT =====
+    autofit_columns(worksheet, [column_width(df.iloc[:, i], col) for i, col in enumerate(df.columns)])
+
+
+def write_sheet_streaming(workbook, sheet, df_raw, formats, chunk_rows=STREAM_CHUNK_ROWS):
+    # mode constant_memory: xlsxwriter hanya menerima penulisan baris demi baris.
+    # Coerce, kode format, mask kosong dan lebar kolom dihitung per chunk, jadi
+    # memory tambahan tidak ikut naik dengan jumlah baris
+    numeric_cols = numeric_columns(df_raw, chunk_rows)
+    pct_cols = [c for c in df_raw.columns if "%" in c]
+
+    worksheet = workbook.add_worksheet(sheet)
+    worksheet.write_row(0, 0, list(df_raw.columns), formats["header"])
+
+    n_rows, n_cols = df_raw.shape
+    default_fmts = [default_format(col, numeric_cols, pct_cols, formats) for col in df_raw.columns]
+    runs = default_row_runs(default_fmts)
+    widths = [len(str(col)) + 2 for col in df_raw.columns]
+
+    for start in range(0, n_rows if n_cols else 0, chunk_rows):
+        df = coerce_columns(df_raw.iloc[start:start + chunk_rows], numeric_cols)
+        codes = build_format_codes(df, sheet, numeric_cols)
+        blank = np.column_stack([
+            blank_mask(df.iloc[:, c], col in numeric_cols) for c, col in enumerate(df.columns)
+        ])
+        plain = ~(codes.any(axis=1) | blank.any(axis=1))
+        widths = [max(w, column_width(df.iloc[:, c], col)) for c, (w, col) in enumerate(zip(widths, df.columns))]
+
+        chunk = zip(*(df.iloc[:, c].tolist() for c in range(n_cols)))
+        for i, row in enumerate(chunk):
+            r = start + i
+            if plain[i]:
+                for c0, c1, fmt in runs:
+                    worksheet.write_row(r + 1, c0, row[c0:c1], fmt)
+                continue
+
+            row_codes, row_blank = codes[i].tolist(), blank[i].tolist()
+            for c in range(n_cols):
+                write_cell(worksheet, r + 1, c, row[c], row_codes[c], row_blank[c], default_fmts[c], formats)
+
+    # ===== AUTOFIT ===== (info kolom baru ditulis ke XML saat workbook di-close)
+    autofit_columns(worksheet, widths)
+
+
+# Fungsi "Super Button" & Formatting
+@profiled("export")
+def generate_multi_sheet_excel(selected_sheets, df_dict):
+
+    output = BytesIO()
+
+    workbook = new_workbook(output)
+    formats = add_formats(workbook)
+
+    for sheet in selected_sheets:
+        write_sheet(workbook, sheet, df_dict[sheet], formats)
+
+    workbook.close()
+
+    output.seek(0)
+    return output.getvalue()
+
+
+def write_serial_workbook(output, selected_sheets, df_dict, tmpdir=None):
+    workbook = new_workbook(output, {"constant_memory": True, "tmpdir": tmpdir})
+    formats = add_formats(workbook)
+
+    for sheet in selected_sheets:
+        write_sheet_streaming(workbook, sheet, df_dict[sheet], formats)
+
+    workbook.close()
+
+
+def write_sheet_part(task):
+    """Worker: tulis satu sheet (constant_memory) ke workbook sementara, return path-nya.
+
+    Mode constant_memory menulis string inline, jadi XML sheet-nya tidak
+    bergantung pada shared strings dan bisa dipindah ke workbook lain apa adanya.
+    """
+    sheet, df_raw, tmpdir = task
+    with tempfile.NamedTemporaryFile(suffix=".xlsx", dir=tmpdir, delete=False) as part:
+        path = part.name
+
+    workbook = new_workbook(path, {"constant_memory": True, "tmpdir": tmpdir})
+    formats = pin_format_indices(add_formats(workbook))
+    write_sheet_streaming(workbook, sheet, df_raw, formats)
+    workbook.close()
+    return path
+
+
+def write_parallel_workbook(output, selected_sheets, df_dict, tmpdir=None, max_workers=None):
+    """Setiap sheet ditulis di process pool, lalu XML-nya dirakit ke satu workbook.
+
+    Kerangka workbook (sheet kosong + styles yang sama) dibuat di proses ini;
+    ``xl/worksheets/sheetN.xml`` di kerangka diganti dengan sheet hasil worker.
+    """
+    skeleton = BytesIO()
+    workbook = new_workbook(skeleton, {"constant_memory": True, "tmpdir": tmpdir})
+    pin_format_indices(add_formats(workbook))
+    for sheet in selected_sheets:
+        workbook.add_worksheet(sheet)
+    workbook.close()
+
+    tasks = [(sheet, df_dict[sheet], tmpdir) for sheet in selected_sheets]
+    workers = min(len(tasks), max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        part_paths = list(pool.map(write_sheet_part, tasks))
+
+    parts = {SHEET_PART.format(i): path for i, path in enumerate(part_paths, 1)}
+    try:
+        with zipfile.ZipFile(skeleton) as src, \
+                zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as dst:
+            for info in src.infolist():
+                if info.filename not in parts:
+                    dst.writestr(info, src.read(info.filename))
+                    continue
+
+                with zipfile.ZipFile(parts[info.filename]) as part, \
+                        part.open(SHEET_PART.format(1)) as xml, \
+                        dst.open(info.filename, "w", force_zip64=True) as f:
+                    # <sheetViews> ada di awal XML (sebelum <cols>/<sheetData>)
+                    head = xml.read(SHEET_HEAD_BYTES)
+                    if info.filename != SHEET_PART.format(1):
+                        # hanya sheet pertama yang aktif, sama seperti workbook biasa
+                        head = head.replace(b' tabSelected="1"', b"", 1)
+                    f.write(head)
+                    shutil.copyfileobj(xml, f)
+    finally:
+        for path in part_paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def use_parallel(selected_sheets, max_workers=None, parallel=None):
+    if not (PARALLEL_EXPORT if parallel is None else parallel):
+        return False
+    workers = max_workers or os.cpu_count() or 1
+    return workers > 1 and len(selected_sheets) >= PARALLEL_MIN_SHEETS
+
+
+def write_streaming_workbook(output, selected_sheets, df_dict, tmpdir=None, max_workers=None, parallel=None):
+    if use_parallel(selected_sheets, max_workers, parallel):
+        write_parallel_workbook(output, selected_sheets, df_dict, tmpdir, max_workers)
+    else:
+        write_serial_workbook(output, selected_sheets, df_dict, tmpdir)
+
+
+@profiled("export")
+def stream_multi_sheet_excel(selected_sheets, df_dict, tmpdir=None):
+    """Sama seperti generate_multi_sheet_excel, tapi ditulis ke temp file.
+
+    Workbook dibuat dengan ``constant_memory`` sehingga baris langsung di-flush
+    ke disk; yang dikembalikan adalah file object (posisi 0) yang bisa langsung
+    dipakai ``st.download_button``.
+    """
+    # buffering=0 -> io.FileIO (RawIOBase), tipe file yang diterima st.download_button
+    output = tempfile.TemporaryFile(suffix=".xlsx", dir=tmpdir, buffering=0)
+    write_streaming_workbook(output, selected_sheets, df_dict, tmpdir)
+    output.seek(0)
+    return output
+
+
+@profiled("export")
+def spool_multi_sheet_excel(selected_sheets, df_dict, tmpdir=None):
+    # versi streaming yang hasilnya disimpan sebagai file bernama (untuk cache)
+    with tempfile.NamedTemporaryFile(suffix=".xlsx", dir=tmpdir, delete=False) as output:
+        write_streaming_workbook(output, selected_sheets, df_dict, tmpdir)
+    return output.name
+
+
+def use_streaming(selected_sheets, df_dict):
+    total_rows = sum(len(df_dict[sheet]) for sheet in selected_sheets)
+    return total_rows > STREAM_THRESHOLD_ROWS
+
+
+def save_multi_sheet_excel(path, selected_sheets, df_dict, parallel=None):
+    """Tulis workbook Super Button langsung ke file (mode batch / CLI)."""
+    if use_streaming(selected_sheets, df_dict):
+        tmpdir = os.path.dirname(os.path.abspath(path))
+        write_streaming_workbook(path, selected_sheets, df_dict, tmpdir=tmpdir, parallel=parallel)
+        return
+    with open(path, "wb") as f:
+        f.write(generate_multi_sheet_excel(selected_sheets, df_dict))
+
+
+# ===== MEMO SUPER BUTTON =====
+def frame_fingerprint(df):
+    """Hash isi DataFrame (kolom, dtype, index, dan nilai)."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def export_key(selected_sheets, df_dict):
+    # urutan sheet ikut menentukan isi workbook, jadi key pakai tuple berurutan
+    return tuple((sheet, frame_fingerprint(df_dict[sheet])) for sheet in selected_sheets)
+
+
+def _open_entry(entry):
+    # dijalankan di dalam lock LRU: temp file tidak bisa ter-evict (dihapus) sebelum dibuka
+    return entry if isinstance(entry, bytes) else open(entry, "rb")
+
+
+def _discard_entry(entry):
+    if isinstance(entry, str):
+        try:
+            os.remove(entry)
+        except OSError:
+            pass
+
+
+class ExportCache:
+    """LRU cache hasil Super Button, dipakai bersama semua session di proses ini.
+
+    Entry kecil disimpan sebagai bytes; export besar (mode streaming) disimpan
+    sebagai temp file dan dihapus saat ter-evict.
+    """
+
+    def __init__(self, maxsize=8):
+        self._lru = LRUCache(max_entries=maxsize, on_evict=_discard_entry)
+
+    @property
+    def hits(self):
+        return self._lru.hits
+
+    @property
+    def misses(self):
+        return self._lru.misses
+
+    def get(self, selected_sheets, df_dict):
+        # workbook dibuat di luar lock global, jadi export lama satu session
+        # tidak menahan download (termasuk cache hit) session lain
+        def generate():
+            if use_streaming(selected_sheets, df_dict):
+                return spool_multi_sheet_excel(selected_sheets, df_dict)
+            return generate_multi_sheet_excel(selected_sheets, df_dict)
+
+        return self._lru.get_or_compute(export_key(selected_sheets, df_dict), generate, load=_open_entry)
+
+    def clear(self):
+        self._lru.clear()
+
+
+EXPORT_CACHE = ExportCache()
+
+
+def cached_multi_sheet_excel(selected_sheets, df_dict):
+    return EXPORT_CACHE.get(selected_sheets, df_dict)
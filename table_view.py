@@ -0,0 +1,106 @@
+"""Tabel ber-halaman untuk st.dataframe.
+
+Angka rupiah selalu tampil format Indonesia (73.230 / 34,19), tidak
+tergantung locale browser: diformat lewat Styler untuk halaman yang dilihat
+saja (string per kolom disiapkan sekaligus lewat rupiah_formatters), nilai
+aslinya tetap dikirim sehingga sorting di frontend tetap numeric. Persentase pakai format printf di column_config.
+Filter ROUND / VENDOR / Scope dan sorting dikerjakan di server sebelum
+slicing.
+"""
+import math
+
+import pandas as pd
+import streamlit as st
+
+from formatting import rupiah_formatters, total_styles
+from profiling import profile_stage
+
+PAGE_SIZE = 200
+FILTER_COLS = ["ROUND", "VENDOR"]
+SEARCH_COL = "Scope"
+NO_SORT = "(original order)"
+
+
+def number_config(df, formats=None):
+    """column_config untuk ``formats`` = {kolom: format printf}, mis. "%.1f%%"."""
+    return {
+        col: st.column_config.NumberColumn(format=fmt)
+        for col, fmt in (formats or {}).items()
+        if col in df.columns
+    }
+
+
+def highlighted(df, highlight=total_styles, num_cols=()):
+    """Styler untuk satu halaman: rupiah format Indonesia + warna highlight.
+
+    DataFrame polos kalau tidak ada kolom rupiah dan tidak ada yang di-highlight.
+    """
+    rupiah_cols = [col for col in num_cols if col in df.columns]
+    styles = highlight(df) if highlight is not None else None
+    has_highlight = styles is not None and (styles.to_numpy() != "").any()
+    if not rupiah_cols and not has_highlight:
+        return df
+
+    styler = df.style
+    if rupiah_cols:
+        # column_config format mengalahkan Styler, jadi kolom ini tidak diberi format di sana
+        styler = styler.format(rupiah_formatters(df, rupiah_cols), subset=rupiah_cols)
+    if has_highlight:
+        styler = styler.apply(lambda _: styles, axis=None)
+    return styler
+
+
+def render_page(df, num_cols, formats=None, highlight=total_styles):
+    st.dataframe(highlighted(df, highlight, num_cols), column_config=number_config(df, formats), hide_index=True)
+
+
+def sort_key(s):
+    # kategori label urut kemunculan (compact_merge) -> urut teks; ROUND (ordered) tetap urut natural
+    if isinstance(s.dtype, pd.CategoricalDtype) and not s.dtype.ordered:
+        return s.astype("string")
+    return s
+
+
+def filter_and_sort(df, key):
+    view = df
+    columns = [c for c in FILTER_COLS if c in df.columns]
+    has_search = SEARCH_COL in df.columns
+
+    widgets = st.columns(len(columns) + int(has_search) + 2)
+    for widget, col in zip(widgets, columns):
+        selected = widget.multiselect(col, options=list(pd.unique(df[col].dropna())), key=f"{key}_{col}")
+        if selected:
+            view = view[view[col].isin(selected)]
+
+    if has_search:
+        query = widgets[len(columns)].text_input(SEARCH_COL, key=f"{key}_search")
+        if query:
+            view = view[view[SEARCH_COL].astype(str).str.contains(query, case=False, regex=False, na=False)]
+
+    sort_col = widgets[-2].selectbox("Sort by", [NO_SORT] + list(df.columns), key=f"{key}_sort")
+    descending = widgets[-1].toggle("Descending", key=f"{key}_desc")
+    if sort_col != NO_SORT:
+        view = view.sort_values(
+            sort_col, ascending=not descending, kind="stable", na_position="last", key=sort_key
+        )
+
+    return view
+
+
+def paged_dataframe(df, key, num_cols, formats=None, highlight=total_styles, page_size=PAGE_SIZE):
+    """Render ``df`` per halaman; tabel kecil langsung ditampilkan utuh."""
+    if len(df) <= page_size:
+        with profile_stage(f"table {key}", rows=len(df)):
+            render_page(df, num_cols, formats, highlight)
+        return
+
+    view = filter_and_sort(df, key)
+
+    n_pages = max(1, math.ceil(len(view) / page_size))
+    page = st.number_input("Page", min_value=1, max_value=n_pages, value=1, step=1, key=f"{key}_page")
+    start = (int(page) - 1) * page_size
+    page_df = view.iloc[start:start + page_size]
+
+    with profile_stage(f"table {key}", rows=len(page_df)):
+        render_page(page_df, num_cols, formats, highlight)
+    st.caption(f"Rows {start + 1 if len(view) else 0:,}–{start + len(page_df):,} of {len(view):,} (page {int(page)} / {n_pages})")
@@ -0,0 +1,65 @@
+"""Pemanasan cache bersama sekali per proses server, bukan per session.
+
+Dipanggil di akhir run pertama (setelah halaman selesai dikirim), jadi tidak
+menunda first paint. Di background thread: import modul berat yang baru
+dipakai saat export / parsing, lalu:
+
+- hasil analisis + workbook dummy dataset diisi ke ANALYSIS_CACHE dan
+  EXPORT_CACHE, jadi "Run in background" di session mana pun kena cache;
+- workbook Super Button untuk ``exports`` dari app (tabel contoh di guide,
+  dengan pilihan sheet default) diisi ke EXPORT_CACHE, jadi download Super
+  Button pertama dengan pilihan default juga kena cache.
+"""
+import importlib
+import logging
+import os
+import threading
+
+from dummy_dataset import BASE_DIR, DUMMY_FILES
+
+WARM_MODULES = ["openpyxl", "xlsxwriter", "altair"]
+
+logger = logging.getLogger(__name__)
+
+_started = False
+_lock = threading.Lock()
+
+
+def warm(exports=()):
+    for name in WARM_MODULES:
+        importlib.import_module(name)
+
+    from pipeline import SERVER_MAX_WORKERS, TABLES, analyze_rounds, server_parse_cache
+    from super_button import cached_multi_sheet_excel
+
+    paths = [os.path.join(BASE_DIR, file_path) for file_path in DUMMY_FILES]
+    tables = analyze_rounds(paths, max_workers=SERVER_MAX_WORKERS, parse_cache=server_parse_cache())
+    for sheets, df_dict in [(TABLES, tables), *exports]:
+        workbook = cached_multi_sheet_excel(sheets, df_dict)
+        if hasattr(workbook, "close"):
+            workbook.close()
+
+
+def _run(exports):
+    try:
+        warm(exports)
+    except Exception:
+        # pemanasan gagal tidak boleh mengganggu app; cache terisi saat dipakai
+        logger.exception("warm-up failed")
+
+
+def start_warmup(exports=()):
+    """Mulai pemanasan di background; hanya sekali per proses.
+
+    ``exports`` = [(urutan sheet, {nama sheet: DataFrame})] yang akan di-download
+    lewat Super Button.
+    """
+    global _started
+    with _lock:
+        if _started:
+            return False
+        _started = True
+    # bukan daemon: proses yang keluar menunggu pemanasan selesai, jadi thread ini
+    # tidak dihentikan di tengah menulis Parquet / workbook (abort di pyarrow)
+    threading.Thread(target=_run, args=(list(exports),), name="upl-warmup", daemon=False).start()
+    return True